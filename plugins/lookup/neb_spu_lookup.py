@@ -102,19 +102,19 @@ from ansible.errors import AnsibleError
 display = Display()
 
 
+# marker for keys that are not defined, as None is a valid variable value
+_MISSING = object()
+
+
 def _try_lookup_key(key, primary=None, fallback=None):
     # type: (str, dict, dict) -> any
     """Lookup a value in a primary and fallback dictionary"""
-    try:
-        if primary is not None and key in primary:
-            return primary[key]
-        if fallback is not None and key in fallback:
-            return fallback[key]
-        return None
-
-    # pylint: disable=broad-except
-    except Exception:
-        return None
+    value = _MISSING
+    if primary is not None:
+        value = primary.get(key, _MISSING)
+    if value is _MISSING and fallback is not None:
+        value = fallback.get(key, _MISSING)
+    return None if value is _MISSING else value
 
 
 LOOKUP_KEYS = [
@@ -128,18 +128,109 @@ LOOKUP_KEYS = [
     "spu_serial",
 ]
 
+# host configuration properties that are only passed to the nPod when set
+OPTIONAL_KEYS = (
+    "bond_mode",
+    "bond_lacp_transmit_rate",
+    "bond_transmit_hash_policy",
+    "dhcp",
+    "mtu",
+    "netmask_bits",
+)
+
+# data network interfaces of an SPU
+IF_LIST = (
+    "enP8p1s0f0np0",
+    "enP8p1s0f1np1",
+)
+
+
+def _build_ip_info_config(interfaces, address, host_config):
+    # type: (list, str, dict) -> dict
+    """Build the IP configuration for a list of SPU interfaces"""
+    ip_info_config = {
+        "interfaces": interfaces,
+        "address": address,
+    }
+    for key in OPTIONAL_KEYS:
+        value = host_config[key]
+        if value is not None:
+            ip_info_config[key] = value
+
+    return ip_info_config
+
 
 def lookup_key_values(**kwargs):
     # type: (any) -> dict
     """Compile the lookup keys dictionary from plugin arguments"""
+    verbose = display.verbosity >= 3
     lookup_keys = {}
     for key in LOOKUP_KEYS:
-        lookup_keys[key] = key if key not in kwargs else kwargs[key]
-        display.vvv(f"Lookup key for '{key}' is: '{lookup_keys[key]}'")
+        lookup_keys[key] = kwargs.get(key, key)
+        if verbose:
+            display.vvv(f"Lookup key for '{key}' is: '{lookup_keys[key]}'")
 
     return lookup_keys
 
 
+def _iter_hosts(groups, terms, verbose=False):
+    # type: (dict, list, bool) -> Iterator[str]
+    """Iterate over the hosts of the requested host groups"""
+
+    # only walk the requested groups, each one once, instead of scanning
+    # every group in the inventory
+    for group in dict.fromkeys(terms):
+        if group not in groups:
+            raise AnsibleError(f"Host group {group} not found in inventory")
+
+        if verbose:
+            display.vvv(f"Processing group {group}...")
+
+        yield from groups[group]
+
+
+def _build_entry(host, hostvars, global_vars, lookup_items, verbose=False):
+    # type: (str, dict, dict, list, bool) -> dict
+    """Convert the configuration of a host for the neb_npod module"""
+    if host not in hostvars:
+        raise AnsibleError(f"Host {host} not found in hostvars")
+
+    if verbose:
+        display.vvv(f"Processing host {host}...")
+    host_vars = hostvars[host]
+
+    # read the configuration properties for the host
+    host_config = {}
+    for key, lookup_key in lookup_items:
+        value = _try_lookup_key(lookup_key, host_vars, global_vars)
+        host_config[key] = value
+        if verbose:
+            display.vvv(f"Value for {lookup_key}: {value}")
+
+    # depending on the bonding mode, we need to format the
+    # structure of networking differently. First, handle non-bonded
+    # interfaces.
+    spu_address = host_config["spu_address"]
+    if host_config["bond_mode"] == "BondModeNone":
+        ip_info_list = [
+            _build_ip_info_config([IF_LIST[if_index]], address, host_config)
+            for if_index, address in enumerate(spu_address.split(","))
+        ]
+
+    else:
+        # bonded interfaces share a single address
+        ip_info_list = [
+            _build_ip_info_config(list(IF_LIST), spu_address, host_config),
+        ]
+
+    # convert properties for a suitable input format
+    # for the neb_npod module
+    return {
+        "spu_serial": host_config["spu_serial"],
+        "ip_info_config": ip_info_list,
+    }
+
+
 class LookupModule(LookupBase):
     """SPU configuration information lookup module"""
     def run(self, terms, variables=None, **kwargs):
@@ -149,93 +240,22 @@ class LookupModule(LookupBase):
         if variables is None:
             raise AnsibleError("Could not load variables")
 
-        # make sure that there is one group name provided and that it exists
+        # make sure that there is one group name provided
         if len(terms) == 0:
             raise AnsibleError("Host group not provided")
 
-        for term in terms:
-            if term not in variables["groups"]:
-                raise AnsibleError(f"Host group {term} not found in inventory")
-
         # define the lookup keys
         lookup_keys = lookup_key_values(**kwargs)
+        lookup_items = list(lookup_keys.items())
 
-        ret = []
-        for group, hosts in variables["groups"].items():
-            if group not in terms:
-                continue
+        # debug messages are only formatted when they are displayed
+        verbose = display.verbosity >= 3
 
-            display.vvv(f"Processing group {group}...")
+        groups = variables["groups"]
+        hostvars = variables["hostvars"]
+        global_vars = variables["vars"]
 
-            for host in hosts:
-                if host not in variables["hostvars"].keys():
-                    raise AnsibleError(f"Host {host} not found in hostvars")
-
-                display.vvv(f"Processing host {host}...")
-                host_vars = variables["hostvars"][host]
-
-                # read the configuration properties for the host
-                host_config = {}
-                for key, lookup_key in lookup_keys.items():
-                    host_config[key] = _try_lookup_key(
-                        lookup_key, host_vars, variables["vars"]
-                    )
-                    display.vvv(f"Value for {lookup_key}: {host_config[key]}")
-
-                # convert properties for a suitable input format
-                # for the neb_npod module
-                entry = {}
-                entry["spu_serial"] = host_config["spu_serial"]
-                entry["ip_info_config"] = []
-
-                # depending on the bonding mode, we need to format the
-                # structure of networking differently. First, handle non-bonded
-                # interfaces.
-                if_list = ["enP8p1s0f0np0", "enP8p1s0f1np1"]
-
-                if host_config["bond_mode"] == "BondModeNone":
-                    if_index = 0
-                    for address in host_config["spu_address"].split(","):
-                        ip_info_config = {}
-                        ip_info_config["interfaces"] = [if_list[if_index]]
-                        ip_info_config["address"] = address
-
-                        optional_keys = [
-                            "bond_mode",
-                            "bond_lacp_transmit_rate",
-                            "bond_transmit_hash_policy",
-                            "dhcp",
-                            "mtu",
-                            "netmask_bits",
-                        ]
-
-                        for key in optional_keys:
-                            if host_config[key] is not None:
-                                ip_info_config[key] = host_config[key]
-
-                        entry["ip_info_config"].append(ip_info_config)
-                        if_index += 1
-
-                else:
-                    ip_info_config = {}
-                    ip_info_config["interfaces"] = if_list
-                    ip_info_config["address"] = host_config["spu_address"]
-
-                    optional_keys = [
-                        "bond_mode",
-                        "bond_lacp_transmit_rate",
-                        "bond_transmit_hash_policy",
-                        "dhcp",
-                        "mtu",
-                        "netmask_bits",
-                    ]
-
-                    for key in optional_keys:
-                        if host_config[key] is not None:
-                            ip_info_config[key] = host_config[key]
-
-                    entry["ip_info_config"].append(ip_info_config)
-
-                ret.append(entry)
-
-        return ret
+        return [
+            _build_entry(host, hostvars, global_vars, lookup_items, verbose)
+            for host in _iter_hosts(groups, terms, verbose)
+        ]
@@ -25,33 +25,72 @@ __all__ = [
     "to_dict",
 ]
 
+# leaf types that are returned unchanged without further inspection
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None), bytes))
+
 
 def to_dict(src):
     # type: (any) -> dict
-    """Returns an object as a dict"""
+    """Returns an object as a dict
 
-    result = {}
-    if not hasattr(src, '__dict__'):
+    Objects referenced more than once within src are converted once, so every
+    reference to them shares the same dict in the result.
+    """
+
+    if type(src) in _PRIMITIVE_TYPES or not hasattr(src, '__dict__'):
         return src
 
-    fields = src.__dict__
-    type_name = type(src).__name__
+    # walk the object graph with an explicit stack instead of recursion. Each
+    # entry holds an object and the dict that receives its converted fields.
+    result = {}
+    stack = [(src, result)]
+
+    # objects referenced more than once are only converted once. The memo is
+    # keyed by id(), which is stable as all objects are reachable from src.
+    memo = {id(src): result}
+
+    def convert(value):
+        converted = memo.get(id(value))
+        if converted is None:
+            converted = memo[id(value)] = {}
+            stack.append((value, converted))
+        return converted
+
+    while stack:
+        obj, target = stack.pop()
+        prefix = f'_{type(obj).__name__}__'
+        prefix_len = len(prefix)
+
+        for key, value in vars(obj).items():
+
+            # cleanup the key
+            clean_key = key[prefix_len:] if key.startswith(prefix) else key
 
-    for key in fields:
+            # most fields are plain values that need no conversion
+            if type(value) in _PRIMITIVE_TYPES:
+                target[clean_key] = value
+                continue
 
-        # cleanup the key
-        clean_key = key.replace(f'_{type_name}__', '')
+            # convert Enums
+            if isinstance(value, Enum):
+                target[clean_key] = value.value
+                continue
 
-        # convert Enums
-        if isinstance(fields[key], Enum):
-            result[clean_key] = fields[key].value
-            continue
+            # convert arrays / lists
+            if isinstance(value, list):
+                items = [None] * len(value)
+                for index, item in enumerate(value):
+                    if type(item) not in _PRIMITIVE_TYPES and hasattr(item, '__dict__'):
+                        items[index] = convert(item)
+                    else:
+                        items[index] = item
+                target[clean_key] = items
+                continue
 
-        # convert arrays / lists
-        if isinstance(fields[key], list):
-            result[clean_key] = [to_dict(i) for i in fields[key]]
-            continue
+            if hasattr(value, '__dict__'):
+                target[clean_key] = convert(value)
+                continue
 
-        result[clean_key] = to_dict(fields[key])
+            target[clean_key] = value
 
     return result
@@ -21,7 +21,6 @@ __metaclass__ = type
 
 import sys
 import os
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils import (
     validate_sdk,
@@ -33,26 +32,35 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# prefer orjson for parsing SDK responses if it is available
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
 __all__ = [
     "get_login_arguments",
     "get_client"
 ]
 
-COMPATIBLE_SDK_VERSIONS = [
+COMPATIBLE_SDK_VERSIONS = frozenset((
     "2.0.8",
     "2.0.10",
-]
+))
 REQ_PYTHON_VERSION_MAJOR = 3
 REQ_PYTHON_VERSION_MINOR = 6
 
+# the Python version can't change during the lifetime of the process
+_PY_OK = sys.version_info >= (REQ_PYTHON_VERSION_MAJOR, REQ_PYTHON_VERSION_MINOR)
+
 # Need to statically provide the collection version here as the standard files
 # where this information can be collected from won't be sent to the remote
 # machine.
@@ -71,7 +79,7 @@ def get_login_arguments():
 def is_python_compatible(module, major_version, minor_version):
     # type: (AnsibleModule, int, int) -> None
     """Checks if the installed Python version is compatible with the requirement"""
-    if major_version <= REQ_PYTHON_VERSION_MAJOR and minor_version < REQ_PYTHON_VERSION_MINOR:
+    if (major_version, minor_version) < (REQ_PYTHON_VERSION_MAJOR, REQ_PYTHON_VERSION_MINOR):
 
         err_msg = "The Nebulon Ansible Collection requires Python version"
         err_msg += f" {REQ_PYTHON_VERSION_MAJOR}.{REQ_PYTHON_VERSION_MINOR} or higher."
@@ -79,6 +87,13 @@ def is_python_compatible(module, major_version, minor_version):
         module.fail_json(msg=err_msg)
 
 
+def _parse_with_orjson(response, *args, **kwargs):
+    # type: (any, any, any) -> any
+    """Response hook that parses the JSON body of a response with orjson"""
+    response.json = lambda **_kwargs: _orjson_loads(response.content)
+    return response
+
+
 def get_client(module):
     # type: (AnsibleModule) -> NebPyClient
     """Setup nebulon ON connection"""
@@ -97,7 +112,8 @@ def get_client(module):
     client_version = f'{module.ansible_version},{COLLECTION_VERSION}'
 
     # check for Python compatibility
-    is_python_compatible(module, sys.version_info.major, sys.version_info.minor)
+    if not _PY_OK:
+        is_python_compatible(module, sys.version_info.major, sys.version_info.minor)
 
     # check for Nebulon SDK compatibility
     validate_sdk(
@@ -109,7 +125,12 @@ def get_client(module):
 
     try:
 
-        # try signing in to nebulon ON, will raise an Exception on failure
+        # try signing in to nebulon ON, will raise an Exception on failure.
+        # The client sends all requests through one requests.Session, so
+        # connections are kept alive between calls and responses are
+        # requested gzip or deflate compressed by the session's default
+        # headers. Its default pool holds 10 connections, which covers the
+        # thread pools used by the modules.
         client = NebPyClient(
             username=neb_username,
             password=neb_password,
@@ -118,6 +139,11 @@ def get_client(module):
             verbose=False,
         )
 
+        # the SDK parses every GraphQL response with response.json(), so
+        # replace it on the responses of this client's session only
+        if _orjson_loads is not None:
+            client.session.hooks['response'].append(_parse_with_orjson)
+
         # login succeeded, return the client
         return client
 
@@ -21,11 +21,14 @@ __metaclass__ = type
 
 import platform
 import sys
-import re
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from ansible.module_utils.basic import (
     missing_required_lib,
 )
+from ansible_collections.nebulon.nebulon_on.plugins.module_utils.class_utils import (
+    to_dict,
+)
 
 # safe import of the Nebulon Python SDK
 try:
@@ -33,6 +36,7 @@ try:
         NebPyClient,
         NPod,
         NPodFilter,
+        PageInput,
         UUIDFilter,
         Volume,
         VolumeFilter,
@@ -44,19 +48,35 @@ except ImportError:
 
 __all__ = [
     'get_npod',
+    'get_npods',
     'get_volume',
+    'get_volumes',
+    'iter_pages',
     'validate_sdk',
     'to_dict',
 ]
 
-RE_VERSION = "^([0-9]+)[.]([0-9]+)[.]([0-9]+)$"
-RE_VERSION_OK = "^[*]|(([*]|[0-9]+|[[0-9]+-[0-9]+])([.]([*]|[0-9]+|[[0-9]+-[0-9]+])){1,2})$"
+# characters allowed in the numeric segments of a version
+_DIGITS = frozenset('0123456789')
+
+# host details for error messages; constant for the process
+_HOSTNAME = platform.node()
+_EXECUTABLE = sys.executable
 
+_INCOMPAT_MSG_TPL = (
+    "Installed nebpyclient version ({version}) on {hostname}'s Python {executable} "
+    "is incompatible with this module. The module requires one of the following "
+    "versions of the nebpyclient library installed: {ok_versions_str}. "
+    "Please install one of the supported versions. If the required version "
+    "is installed, but Ansible is using the wrong Python interpreter, "
+    "please consult the documentation on ansible_python_interpreter"
+)
 
-COMPATIBLE_SDK_VERSIONS = [
+
+COMPATIBLE_SDK_VERSIONS = frozenset((
     "2.0.8",
     "2.0.10",
-]
+))
 
 
 def validate_sdk(module, version=None, import_error=None, ok_versions=None):
@@ -66,10 +86,20 @@ def validate_sdk(module, version=None, import_error=None, ok_versions=None):
     # if the version is not provided, that means that the SDK
     # could not be loaded
     if version is None:
+        error_details = str(import_error)
+        error_class = type(import_error).__name__
+
+        # modules may pass the ImportError itself, which is only formatted
+        # here when it is actually reported
+        if isinstance(import_error, BaseException):
+            import traceback
+            error_details = "".join(traceback.format_exception(
+                type(import_error), import_error, import_error.__traceback__))
+
         module.fail_json(
             msg=missing_required_lib("nebpyclient"),
-            error_details=str(import_error),
-            error_class=type(import_error).__name__,
+            error_details=error_details,
+            error_class=error_class,
         )
 
     # make sure that we have a clean version string
@@ -80,7 +110,7 @@ def validate_sdk(module, version=None, import_error=None, ok_versions=None):
     if ok_versions is None and not _is_sdk_compatible(clean_version, COMPATIBLE_SDK_VERSIONS):
         module.fail_json(
             msg=incompatible_nebulon_sdk(clean_version, COMPATIBLE_SDK_VERSIONS),
-            error_details=f"Compatible versions are {COMPATIBLE_SDK_VERSIONS}",
+            error_details=f"Compatible versions are {sorted(COMPATIBLE_SDK_VERSIONS)}",
         )
 
     # if there is an explicit list of compatible versions
@@ -88,136 +118,189 @@ def validate_sdk(module, version=None, import_error=None, ok_versions=None):
     if ok_versions is not None and not _is_sdk_compatible(clean_version, ok_versions):
         module.fail_json(
             msg=incompatible_nebulon_sdk(clean_version, ok_versions),
-            error_details=f"Compatible versions are {ok_versions}",
+            error_details=f"Compatible versions are {sorted(ok_versions)}",
         )
 
 
 def incompatible_nebulon_sdk(version, ok_versions):
     # type: (str, List[str]) -> str
-
-    hostname = platform.node()
-    executable = sys.executable
-    ok_versions_str = ", ".join(ok_versions)
-    return (
-        f"Installed nebpyclient version ({version}) on {hostname}'s Python {executable} "
-        "is incompatible with this module. The module requires one of the following "
-        f"versions of the nebpyclient library installed: {ok_versions_str}. "
-        "Please install one of the supported versions. If the required version "
-        "is installed, but Ansible is using the wrong Python interpreter, "
-        "please consult the documentation on ansible_python_interpreter"
+    return _INCOMPAT_MSG_TPL.format(
+        version=version,
+        hostname=_HOSTNAME,
+        executable=_EXECUTABLE,
+        ok_versions_str=", ".join(sorted(ok_versions)),
     )
 
 
+def _is_number(value):
+    # type: (str) -> bool
+    """Checks if a string is a non-empty sequence of ASCII digits"""
+    return value != '' and _DIGITS.issuperset(value)
+
+
+def _is_version(version):
+    # type: (str) -> bool
+    """Checks if a string is a version with three numeric segments"""
+    parts = version.split('.')
+    return len(parts) == 3 and all(_is_number(part) for part in parts)
+
+
 def _is_sdk_compatible(version, ok_versions):
     # type: (str, List[str]) -> bool
 
     # make sure that version has the right format
-    version_check = re.compile(RE_VERSION)
-    version_match = version_check.match(version)
-
-    if version_match is None:
+    if not _is_version(version):
         raise ValueError(f'Provided version "{version}" is not valid')
 
-    # regular expression for checking a pattern for defining a compatible
-    # version
-    ok_version_check = re.compile(RE_VERSION_OK)
+    # exact versions don't need to be matched as a pattern
+    exact_versions, version_patterns = _split_ok_versions(tuple(ok_versions))
+    if version in exact_versions:
+        return True
 
     # supported_versions is a list of patterns that describe the supported
     # versions of the required Nebulon library. For example: 1.0.* matches with
     # all of 1.0.1, 1.0.2, ... 1.0.10. Whereas 1.0.[1-2] only matches with
     # 1.0.1 and 1.0.2.
-    for supported_version in ok_versions:
-        # check if the pattern is ok
-        ok_version_match = ok_version_check.match(supported_version)
-        if ok_version_match is None:
-            raise ValueError(f'provided version pattern "{supported_version}" is not valid')
-
-        # we need to modify the passed string as the '.' is supposed to be a
-        # real '.' and not a wildcard character in a regular expression. We're
-        # doing this only to make the passed parameter more legible, because
-        # this will be shown to the user as part of an error message.
-        regex_string = supported_version.replace('.', '[.]')
-
-        # same thing for the '*', which is supposed to be a wildcard character
-        # for any number (or possibly character if we eventually allow
-        # something like '1.0.1a').
-        regex_string = regex_string.replace('*', '([^.]+)')
-
-        # now match the regular expression with the provided version string
-        match_result = re.match(regex_string, version)
-
-        if match_result:
+    version_parts = [int(part) for part in version.split('.')]
+    for supported_version in version_patterns:
+        segments = _parse_version_pattern(supported_version)
+        if all(low <= part <= high for part, (low, high) in zip(version_parts, segments)):
             return True
 
     return False
 
 
-def to_dict(src):
-    # type: (any) -> dict | any
-    """Returns an object as a dict"""
+@lru_cache(maxsize=32)
+def _split_ok_versions(ok_versions):
+    # type: (Tuple[str]) -> Tuple[FrozenSet[str], Tuple[str]]
+    """Splits compatible versions into exact versions and version patterns"""
+    exact_versions = frozenset(
+        v for v in ok_versions if _is_version(v)
+    )
+    version_patterns = tuple(
+        v for v in ok_versions if v not in exact_versions
+    )
+    return exact_versions, version_patterns
 
-    result = {}
-    if not hasattr(src, '__dict__'):
-        return src
 
-    fields = src.__dict__
-    type_name = type(src).__name__
+@lru_cache(maxsize=128)
+def _parse_version_pattern(supported_version):
+    # type: (str) -> Tuple[Tuple[float, float]]
+    """Parses a pattern for compatible versions into (low, high) ranges"""
 
-    for key in fields:
+    # a single '*' matches every version
+    if supported_version == '*':
+        return ()
 
-        # cleanup the key
-        clean_key = key.replace(f'_{type_name}__', '')
+    segments = supported_version.split('.')
+    if len(segments) not in (2, 3):
+        raise ValueError(f'provided version pattern "{supported_version}" is not valid')
 
-        # convert Enums
-        if isinstance(fields[key], Enum):
-            result[clean_key] = fields[key].value
+    # every segment is either a number, a '*' for any number or a range
+    # of numbers like '[1-5]'. A pattern with two segments matches all
+    # versions that start with these segments.
+    ranges = []
+    for segment in segments:
+        if segment == '*':
+            ranges.append((0, float('inf')))
             continue
 
-        # convert arrays / lists
-        if isinstance(fields[key], list):
-            result[clean_key] = [to_dict(i) for i in fields[key]]
+        if _is_number(segment):
+            ranges.append((int(segment), int(segment)))
             continue
 
-        result[clean_key] = to_dict(fields[key])
+        low, _, high = segment[1:-1].partition('-')
+        if segment[:1] != '[' or segment[-1:] != ']' or not _is_number(low) or not _is_number(high):
+            raise ValueError(f'provided version pattern "{supported_version}" is not valid')
+        ranges.append((int(low), int(high)))
+
+    return tuple(ranges)
+
+
+def _lookup_by_uuids(getter, filter_arg, filter_cls, uuids):
+    # type: (Callable, str, type, List[str]) -> Dict[str, object]
+    """Gets SDK objects of one kind for a list of UUIDs with a single query"""
+
+    found = {}
+    unique_uuids = list(dict.fromkeys(uuids))
+    page_number = 1
+    while True:
+        item_list = getter(**{
+            'page': PageInput(page=page_number),
+            filter_arg: filter_cls(
+                uuid=UUIDFilter(
+                    in_filter=unique_uuids
+                )
+            ),
+        })
+        for item in item_list.items:
+            found[item.uuid] = item
+        if not item_list.more:
+            break
+        page_number += 1
 
-    return result
+    return found
+
+
+def get_npods(client, npod_uuids):
+    # type: (NebPyClient, List[str]) -> Dict[str, NPod]
+    """Gets the definitions for a list of nPods with a single query"""
+    return _lookup_by_uuids(
+        client.get_npods, 'npod_filter', NPodFilter, npod_uuids)
 
 
 def get_npod(client, npod_uuid):
     # type: (NebPyClient, str) -> NPod
     """Gets the definition for a nPod"""
 
-    # search for the volume that matches the provided UUID
-    npod_list = client.get_npods(
-        npod_filter=NPodFilter(
-            uuid=UUIDFilter(
-                equals=npod_uuid
-            )
-        )
-    )
+    npods = get_npods(client, [npod_uuid])
 
-    # raise an Exception if the volume is not uniquely identified.
-    if npod_list.filtered_count != 1:
+    # raise an Exception if the nPod is not uniquely identified.
+    if npod_uuid not in npods:
         raise Exception(f"nPod with UUID '{npod_uuid}' not identified")
 
-    return npod_list.items[0]
+    return npods[npod_uuid]
+
+
+def get_volumes(client, volume_uuids):
+    # type: (NebPyClient, List[str]) -> Dict[str, Volume]
+    """Gets the definitions for a list of volumes with a single query"""
+    return _lookup_by_uuids(
+        client.get_volumes, 'volume_filter', VolumeFilter, volume_uuids)
 
 
 def get_volume(client, volume_uuid):
     # type: (NebPyClient, str) -> Volume
     """Gets the definition for a volume"""
 
-    # search for the volume that matches the provided UUID
-    volume_list = client.get_volumes(
-        volume_filter=VolumeFilter(
-            uuid=UUIDFilter(
-                equals=volume_uuid
-            )
-        )
-    )
+    volumes = get_volumes(client, [volume_uuid])
 
     # raise an Exception if the volume is not uniquely identified.
-    if volume_list.filtered_count != 1:
+    if volume_uuid not in volumes:
         raise Exception(f"Volume with UUID '{volume_uuid}' not identified")
 
-    return volume_list.items[0]
+    return volumes[volume_uuid]
+
+
+def iter_pages(get_page, max_workers=8):
+    # type: (Callable[[int], object], int) -> Iterator[object]
+    """Yields all pages of a paginated query in order"""
+
+    # the first page tells how many items match, the remaining pages are
+    # independent of each other and fetched concurrently
+    page = get_page(1)
+    page_number = 1
+    yield page
+
+    if page.more and len(page.items) > 0:
+        page_count = -(-page.filtered_count // len(page.items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for page in executor.map(get_page, range(2, page_count + 1)):
+                page_number += 1
+                yield page
+
+    # pick up items that were added while the pages were fetched
+    while page.more:
+        page_number += 1
+        page = get_page(page_number)
+        yield page
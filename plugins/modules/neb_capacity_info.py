@@ -129,7 +129,7 @@ npod_usable_bytes:
 """
 
 # pylint: disable=wrong-import-position,no-name-in-module,import-error
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.login_utils import (
     get_client,
@@ -146,118 +146,127 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
-# SPU and nPod queries
-RAW_QUERY = 'sum(spu_raw_bytes{%s})'
-DRR_QUERY = 'sum(spu_written_nozero_bytes{%s})/sum(spu_consumed_bytes{%s})'
-USABLE_QUERY = 'sum(spu_usable_bytes{%s})'
-CONSUMED_QUERY = 'sum(spu_consumed_bytes{%s})'
+# prefer orjson for parsing PromQL responses if it is available
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Volume queries
 SIZE_QUERY = 'sum(spu_disk_total{%s,ownership="owner"})'
 WRITTEN_QUERY = 'sum(spu_disk_written{%s,ownership="owner"})'
 
 
-def _run_promql_query(client, query):
-    # type: (NebPyClient, str) -> float
-    """Run a PromQL query against Nebulon ON"""
+class _PromQLClient:
+    """Runs PromQL queries against Nebulon ON using the client's session"""
 
-    payload = f"query={query}"
-    cookie_value = client.session.cookies.get("session-data")
-    headers = {
-        "Content-Type": "application/x-www-form-urlencoded",
-        "Content-Length": str(len(payload)),
-        "Cookie": f"session-data={cookie_value}"
-    }
-    response = client.session.post(
-        url="https://ucapi.nebcloud.nebulon.com/api/v1/query",
-        data=payload,
-        headers=headers,
-    )
-    data = response.json()
-    return _get_value_from_promql(data)
+    def __init__(self, client):
+        # type: (NebPyClient) -> None
+        self._session = client.session
+        cookie_value = client.session.cookies.get("session-data")
+        self._base_headers = {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "Cookie": f"session-data={cookie_value}"
+        }
+
+    def query(self, query):
+        # type: (str) -> float
+        """Run a single PromQL query and return its value"""
+        payload = f"query={query}"
+        headers = dict(self._base_headers)
+        headers["Content-Length"] = str(len(payload))
+        response = self._session.post(
+            url="https://ucapi.nebcloud.nebulon.com/api/v1/query",
+            data=payload,
+            headers=headers,
+        )
+        return _get_value_from_promql(_json_loads(response.content))
+
+    def query_all(self, queries):
+        # type: (list) -> list
+        """Run a set of PromQL queries concurrently"""
+
+        # the queries are independent, so only wait for the slowest round-trip
+        with ThreadPoolExecutor(max_workers=max(1, len(queries))) as executor:
+            return list(executor.map(self.query, queries))
+
+
+def _run_promql_queries(client, queries):
+    # type: (NebPyClient, list) -> list
+    """Run a set of PromQL queries concurrently against Nebulon ON"""
+    return _PromQLClient(client).query_all(queries)
 
 
 def _get_value_from_promql(data):
     # type: (dict) -> float
     """Get the metrics value from a PromQL response"""
-    try:
-        if data['status'] == 'success':
-            value = data['data']['result'][0]['value']
-            value_float = float(value[1])
-            return round(value_float, 2)
-        else:
-            return -1.0
-
-    # pylint: disable=broad-except
-    except Exception:
+    result = (data.get('data') or {}).get('result')
+    if not result or data.get('status') != 'success':
         return -1.0
+    return round(float(result[0]['value'][1]), 2)
+
+
+def _spu_queries(filter_string):
+    # type: (str) -> dict
+    """Get the raw, DRR, usable and consumed queries for SPU metrics"""
+    return {
+        'raw_bytes': f'sum(spu_raw_bytes{{{filter_string}}})',
+        'data_reduction_ratio':
+            f'sum(spu_written_nozero_bytes{{{filter_string}}})/sum(spu_consumed_bytes{{{filter_string}}})',
+        'usable_bytes': f'sum(spu_usable_bytes{{{filter_string}}})',
+        'consumed_bytes': f'sum(spu_consumed_bytes{{{filter_string}}})',
+    }
+
+
+def _get_metrics(client, queries, prefix, fields=None):
+    # type: (NebPyClient, dict, str, set) -> dict
+    """Run the queries for the requested metrics and return them by name"""
+
+    # only query the metrics that were asked for, all if fields is None
+    selected = {
+        f'{prefix}_{name}': query for name, query in queries.items()
+        if fields is None or f'{prefix}_{name}' in fields
+    }
+    values = _run_promql_queries(client, list(selected.values()))
+    return dict(zip(selected, values))
 
 
-def get_spu_capacity(client, spu_serial):
-    # type: (NebPyClient, str) -> dict
+def get_spu_capacity(client, spu_serial, fields=None):
+    # type: (NebPyClient, str, set) -> dict
     """Get capacity information for a SPU"""
 
     filter_string = f'spu_serial="{spu_serial}"'
-
-    # setup queries
-    spu_raw_query = RAW_QUERY % filter_string
-    spu_drr_query = DRR_QUERY % (filter_string, filter_string)
-    spu_usable_query = USABLE_QUERY % filter_string
-    spu_consumed_query = CONSUMED_QUERY % filter_string
-
-    result = {
-        'spu_raw_bytes': _run_promql_query(client, spu_raw_query),
-        'spu_data_reduction_ratio': _run_promql_query(client, spu_drr_query),
-        'spu_usable_bytes': _run_promql_query(client, spu_usable_query),
-        'spu_consumed_bytes': _run_promql_query(client, spu_consumed_query),
-    }
-    return result
+    return _get_metrics(client, _spu_queries(filter_string), 'spu', fields)
 
 
-def get_volume_capacity(client, volume_uuid):
-    # type: (NebPyClient, str) -> dict
+def get_volume_capacity(client, volume_uuid, fields=None):
+    # type: (NebPyClient, str, set) -> dict
     """Get capacity information for a volume"""
 
     filter_string = f'id="{volume_uuid}"'
 
     # setup queries
-    volume_size_query = SIZE_QUERY % filter_string
-    volume_host_written_query = WRITTEN_QUERY % filter_string
-
-    result = {
-        'volume_size_bytes': _run_promql_query(client, volume_size_query),
-        'volume_host_written_bytes': _run_promql_query(client, volume_host_written_query),
+    queries = {
+        'size_bytes': SIZE_QUERY % filter_string,
+        'host_written_bytes': WRITTEN_QUERY % filter_string,
     }
-    return result
+    return _get_metrics(client, queries, 'volume', fields)
 
 
-def get_npod_capacity(client, npod_uuid):
-    # type: (NebPyClient, str) -> dict
+def get_npod_capacity(client, npod_uuid, fields=None):
+    # type: (NebPyClient, str, set) -> dict
     """Get capacity information for a nPod"""
 
     filter_string = f'pod="{npod_uuid}"'
-
-    # setup queries
-    spu_raw_query = RAW_QUERY % filter_string
-    spu_drr_query = DRR_QUERY % (filter_string, filter_string)
-    spu_usable_query = USABLE_QUERY % filter_string
-    spu_consumed_query = CONSUMED_QUERY % filter_string
-
-    result = {
-        'npod_raw_bytes': _run_promql_query(client, spu_raw_query),
-        'npod_data_reduction_ratio': _run_promql_query(client, spu_drr_query),
-        'npod_usable_bytes': _run_promql_query(client, spu_usable_query),
-        'npod_consumed_bytes': _run_promql_query(client, spu_consumed_query),
-    }
-    return result
+    return _get_metrics(client, _spu_queries(filter_string), 'npod', fields)
 
 
 def main():
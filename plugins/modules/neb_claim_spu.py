@@ -64,7 +64,6 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils import (
     validate_sdk,
@@ -77,14 +76,15 @@ from ansible_collections.nebulon.nebulon_on.plugins.module_utils.login_utils imp
 # safe import of the Nebulon Python SDK
 try:
     from nebpyclient import (
+        PageInput,
         SpuFilter,
         StringFilter,
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
@@ -95,15 +95,14 @@ def spu_exist(client, spu_serial):
     # type: (NebPyClient, str) -> bool
     """Checks SPU existence"""
     spu_list = client.get_spus(
+        page=PageInput(page=1, count=1),
         spu_filter=SpuFilter(
             serial=StringFilter(
                 equals=spu_serial
             )
         )
     )
-    if len(spu_list.items) > 0:
-        return True
-    return False
+    return spu_list.filtered_count > 0
 
 
 def claim_spu(module, client, spu_serial):
@@ -71,7 +71,6 @@ EXAMPLES = r"""
 RETURN = r"""
 """
 
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.login_utils import (
     get_client,
@@ -84,6 +83,7 @@ from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils impor
 # safe import of the Nebulon Python SDK
 try:
     from nebpyclient import (
+        PageInput,
         Volume,
         VolumeFilter,
         StringFilter,
@@ -92,9 +92,9 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
@@ -104,7 +104,10 @@ else:
 def get_clone(module, client, clone_name, parent_volume_uuid):
     # type: (AnsibleModule, NebPyClient, str, str) -> Volume
     """Get the volume clone that matches the specified name and parent volume UUID"""
+    # filtered_count tells whether there are duplicates, so a single item
+    # is enough for both lookups
     volume_list = client.get_volumes(
+        page=PageInput(page=1, count=1),
         volume_filter=VolumeFilter(
             uuid=UUIDFilter(
                 equals=parent_volume_uuid
@@ -121,6 +124,7 @@ def get_clone(module, client, clone_name, parent_volume_uuid):
     parent_volume = volume_list.items[0]
 
     clone_list = client.get_volumes(
+        page=PageInput(page=1, count=1),
         volume_filter=VolumeFilter(
             name=StringFilter(
                 equals=clone_name
@@ -121,7 +121,6 @@ note:
 """
 
 # pylint: disable=wrong-import-position,no-name-in-module,import-error
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.login_utils import (
     get_client,
@@ -142,20 +141,27 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# module parameters identifying a host and the matching host properties
+_HOST_IDENTIFIERS = {
+    'host_uuid': 'uuid',
+    'host_chassis_serial': 'chassis_serial',
+    'host_board_serial': 'board_serial',
+}
+
 
 def get_host_with_filter(client, host_filter):
     # type: (NebPyClient, HostFilter) -> Host
     """Get host data via a filter"""
 
-    if filter is None:
+    if host_filter is None:
         raise ValueError("Please provide a valid host filter")
 
     host_list = client.get_hosts(
@@ -168,22 +174,17 @@ def get_host_with_filter(client, host_filter):
     return host_list.items[0]
 
 
-def get_host_by_uuid(client, host_uuid):
-    # type: (NebPyClient, str) -> Host
-    """Get host data via host UUID"""
-
-    if host_uuid is None:
-        raise ValueError("Please provide a valid host identifier")
-
-    host_filter = HostFilter(
-        uuid=StringFilter(
-            equals=host_uuid
-        )
-    )
+def _get_host_by_field(client, field, value):
+    # type: (NebPyClient, str, str) -> Host
+    """Get host data via an exact match on a host property"""
 
     return get_host_with_filter(
         client=client,
-        host_filter=host_filter,
+        host_filter=HostFilter(**{
+            field: StringFilter(
+                equals=value
+            )
+        }),
     )
 
 
@@ -202,57 +203,10 @@ def get_host_by_spu_serial(client, spu_serial):
         )
     )
 
-    if spu_list.filtered_count == 1:
-        host_filter = HostFilter(
-            uuid=StringFilter(
-                equals=spu_list.items[0].host_uuid
-            )
-        )
-
-        return get_host_with_filter(
-            client=client,
-            host_filter=host_filter,
-        )
-
-    raise Exception("Host could not be identified")
-
-
-def get_host_by_chassis_serial(client, host_chassis_serial):
-    # type: (NebPyClient, str) -> Host
-    """Get host data via host chassis serial number"""
-
-    if host_chassis_serial is None:
-        raise ValueError("Please provide a valid chassis serial number")
-
-    host_filter = HostFilter(
-        chassis_serial=StringFilter(
-            equals=host_chassis_serial
-        )
-    )
-
-    return get_host_with_filter(
-        client=client,
-        host_filter=host_filter,
-    )
-
-
-def get_host_by_board_serial(client, host_board_serial):
-    # type: (NebPyClient, str) -> Host
-    """Get host data via host board serial number"""
-
-    if host_board_serial is None:
-        raise ValueError("Please provide a valid board serial number")
-
-    host_filter = HostFilter(
-        board_serial=StringFilter(
-            equals=host_board_serial
-        )
-    )
+    if spu_list.filtered_count != 1:
+        raise Exception("Host could not be identified")
 
-    return get_host_with_filter(
-        client=client,
-        host_filter=host_filter,
-    )
+    return _get_host_by_field(client, 'uuid', spu_list.items[0].host_uuid)
 
 
 def update_host(client, host_uuid, host_name=None, note=None):
@@ -270,44 +224,45 @@ def update_host(client, host_uuid, host_name=None, note=None):
     return host
 
 
+# setup the Ansible module arguments
+_MODULE_ARGS = dict(
+    host_uuid=dict(
+        required=False,
+        type='str',
+    ),
+    spu_serial=dict(
+        required=False,
+        type='str',
+    ),
+    host_chassis_serial=dict(
+        required=False,
+        type='str',
+    ),
+    host_board_serial=dict(
+        required=False,
+        type='str',
+    ),
+    host_name=dict(
+        required=False,
+        type='str',
+        default=None,
+    ),
+    note=dict(
+        required=False,
+        type='str',
+        default=None,
+    ),
+)
+# append the standard login arguments to the module
+_MODULE_ARGS.update(get_login_arguments())
+
+
 def main():
     """Main entry point"""
 
-    # setup the Ansible module arguments
-    module_args = dict(
-        host_uuid=dict(
-            required=False,
-            type='str',
-        ),
-        spu_serial=dict(
-            required=False,
-            type='str',
-        ),
-        host_chassis_serial=dict(
-            required=False,
-            type='str',
-        ),
-        host_board_serial=dict(
-            required=False,
-            type='str',
-        ),
-        host_name=dict(
-            required=False,
-            type='str',
-            default=None,
-        ),
-        note=dict(
-            required=False,
-            type='str',
-            default=None,
-        ),
-    )
-    # append the standard login arguments to the module
-    module_args.update(get_login_arguments())
-
     # set up the module
     module = AnsibleModule(
-        argument_spec=module_args,
+        argument_spec=_MODULE_ARGS,
         supports_check_mode=True,
         mutually_exclusive=[
             ('host_uuid', 'spu_serial', 'host_chassis_serial', 'host_board_serial'),
@@ -334,47 +289,35 @@ def main():
         client = get_client(module)
 
         # read module parameters
-        host_uuid = module.params['host_uuid']
         spu_serial = module.params['spu_serial']
-        host_chassis_serial = module.params['host_chassis_serial']
-        host_board_serial = module.params['host_board_serial']
         host_name = module.params['host_name']
         note = module.params['note']
 
         # find the current host properties of the server to check if we need to
-        # change it
-        if host_uuid is not None:
-            host = get_host_by_uuid(
-                client=client,
-                host_uuid=host_uuid,
-            )
-        elif spu_serial is not None:
+        # change it. Exactly one identifier is provided, and the lookup
+        # functions raise an Exception when the host is not found.
+        if spu_serial is not None:
             host = get_host_by_spu_serial(
                 client=client,
                 spu_serial=spu_serial,
             )
-        elif host_chassis_serial is not None:
-            host = get_host_by_chassis_serial(
-                client=client,
-                host_chassis_serial=host_chassis_serial,
-            )
-        elif host_board_serial is not None:
-            host = get_host_by_board_serial(
-                client=client,
-                host_board_serial=host_board_serial,
-            )
         else:
-            # this branch is never reached as the other functions will raise
-            # an Exception when the host is not found, but keeping this to
-            # keep IDEs from complaining
-            host = None
+            param, field = next(
+                (param, field) for param, field in _HOST_IDENTIFIERS.items()
+                if module.params[param] is not None
+            )
+            host = _get_host_by_field(client, field, module.params[param])
 
         # check if we need to make changes
         change_hostname = host_name is not None and host_name != host.name
         change_note = note is not None and note != host.note
 
-        # handle check mode
+        # handle check mode, the host is looked up but never updated. The
+        # result holds the properties that a real run would return.
         if module.check_mode:
+            result['host_name'] = host_name if change_hostname else host.name
+            result['note'] = note if change_note else host.note
+
             if change_hostname and change_note:
                 result['changed'] = True
                 result['msg'] = "Would change the host display name and note"
@@ -397,14 +340,12 @@ def main():
         # make any changes if necessary
         if change_hostname or change_note:
 
-            # we can send both properties to this function as the provided
-            # values are either None (ignored by the API) or set to a value
-            # that must be set as an idempotent call.
+            # only send the properties that differ, None is ignored by the API
             updated_host = update_host(
                 client=client,
                 host_uuid=host.uuid,
-                host_name=host_name,
-                note=note,
+                host_name=host_name if change_hostname else None,
+                note=note if change_note else None,
             )
 
             result['changed'] = True
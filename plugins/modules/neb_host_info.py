@@ -168,9 +168,9 @@ hosts:
       type: str
 """
 
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils import (
+    iter_pages,
     to_dict,
     validate_sdk,
 )
@@ -190,76 +190,84 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# upper bound for concurrent page requests to nebulon ON
+_PAGE_WORKERS = 8
+
+# number of hosts requested per page; the SDK default is 100
+_PAGE_SIZE = 500
+
+# host filter properties and the module parameters providing their values
+_FILTER_PARAMS = (
+    ('uuid', 'host_uuid'),
+    ('name', 'host_name'),
+    ('model', 'host_model'),
+    ('manufacturer', 'host_manufacturer'),
+    ('chassis_serial', 'host_chassis_serial'),
+    ('board_serial', 'host_board_serial'),
+)
+
+
+def _build_host_filter(params):
+    # type: (dict) -> HostFilter
+    """Builds the host filter for the provided module parameters"""
+
+    # chain a filter for every provided parameter; without any, all hosts
+    # are listed
+    host_filter = None
+    for field, param in reversed(_FILTER_PARAMS):
+        value = params[param]
+        if value is not None:
+            host_filter = HostFilter(
+                and_filter=host_filter,
+                **{field: StringFilter(equals=value)}
+            )
+    return host_filter
+
 
 def get_host_info_list(module, client):
     # type: (AnsibleModule, NebPyClient) -> list[dict]
     """Retrieves a list of hosts"""
-    host_info_list = []
-    page_number = 1
-    while True:
-        host_list = client.get_hosts(
-            page=PageInput(page=page_number),
-            host_filter=HostFilter(
-                uuid=StringFilter(
-                    equals=module.params['host_uuid']
-                ),
-                and_filter=HostFilter(
-                    name=StringFilter(
-                        equals=module.params['host_name']
-                    ),
-                    and_filter=HostFilter(
-                        model=StringFilter(
-                            equals=module.params['host_model']
-                        ),
-                        and_filter=HostFilter(
-                            manufacturer=StringFilter(
-                                equals=module.params['host_manufacturer']
-                            ),
-                            and_filter=HostFilter(
-                                chassis_serial=StringFilter(
-                                    equals=module.params['host_chassis_serial']
-                                ),
-                                and_filter=HostFilter(
-                                    board_serial=StringFilter(
-                                        equals=module.params['host_board_serial']
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-            )
+
+    # the filter is the same for every page, so it is built only once
+    host_filter = _build_host_filter(module.params)
+
+    def get_page(page_number):
+        return client.get_hosts(
+            page=PageInput(page=page_number, count=_PAGE_SIZE),
+            host_filter=host_filter,
         )
-        for host in host_list.items:
-            host_info_list.append(to_dict(host))
-        if not host_list.more:
-            break
-        page_number += 1
+
+    # convert each page as it arrives so that only few pages of SDK objects
+    # are held in memory at a time
+    host_info_list = []
+    for host_list in iter_pages(get_page, _PAGE_WORKERS):
+        host_info_list.extend(to_dict(host) for host in host_list.items)
 
     return host_info_list
 
 
-def main():
-    module_args = dict(
-        host_uuid=dict(required=False, type='str'),
-        host_name=dict(required=False, type='str'),
-        host_model=dict(required=False, type='str'),
-        host_manufacturer=dict(required=False, type='str'),
-        host_chassis_serial=dict(required=False, type='str'),
-        host_board_serial=dict(required=False, type='str'),
-    )
-    module_args.update(get_login_arguments())
+_MODULE_ARGS = dict(
+    host_uuid=dict(required=False, type='str'),
+    host_name=dict(required=False, type='str'),
+    host_model=dict(required=False, type='str'),
+    host_manufacturer=dict(required=False, type='str'),
+    host_chassis_serial=dict(required=False, type='str'),
+    host_board_serial=dict(required=False, type='str'),
+)
+_MODULE_ARGS.update(get_login_arguments())
 
+
+def main():
     module = AnsibleModule(
-        argument_spec=module_args,
+        argument_spec=_MODULE_ARGS,
         supports_check_mode=True,
     )
 
@@ -118,8 +118,7 @@ RETURN = r"""
 """
 
 # pylint: disable=wrong-import-position,no-name-in-module,import-error
-import copy
-import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from ansible.module_utils.basic import (
     AnsibleModule,
     missing_required_lib,
@@ -145,14 +144,17 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# upper bound for concurrent LUN deletions
+_DELETE_WORKERS = 10
+
 
 def delete_luns(module, client):
     # type: (AnsibleModule, NebPyClient) -> dict
@@ -163,6 +165,10 @@ def delete_luns(module, client):
     )
     lun_uuids = module.params['lun_uuids']
 
+    # nothing to delete, and an empty filter must not be sent to the server
+    if len(lun_uuids) == 0:
+        return result
+
     lun_list = client.get_luns(
         lun_filter=LUNFilter(
             uuid=UUIDFilter(
@@ -175,14 +181,23 @@ def delete_luns(module, client):
         result['changed'] = False
         return result
 
-    try:
-        for lun in lun_list.items:
-            client.delete_lun(
-                lun_uuid=lun.uuid
-            )
-    # pylint: disable=broad-except
-    except Exception as err:
-        module.fail_json(msg=str(err))
+    # batch deletion of LUNs is broken in SDK version 2.0.8, so the LUNs are
+    # deleted individually, but concurrently
+    errors = []
+    with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as executor:
+        futures = [
+            executor.submit(client.delete_lun, lun_uuid=lun.uuid)
+            for lun in lun_list.items
+        ]
+        for future in as_completed(futures):
+            # pylint: disable=broad-except
+            try:
+                future.result()
+            except Exception as err:
+                errors.append(str(err))
+
+    if len(errors) > 0:
+        module.fail_json(msg="; ".join(errors))
 
     result['changed'] = True
     return result
@@ -196,48 +211,56 @@ def create_luns(module, client):
         changed=False
     )
     volume_uuid = module.params['volume_uuid']
-    spu_serials = copy.deepcopy(module.params['spu_serials'])
+    # SPU serials as an insertion ordered set
+    spu_serials = dict.fromkeys(module.params['spu_serials'])
     lun_id = module.params['lun_id']
-    host_uuids = copy.deepcopy(module.params['host_uuids'])
-
-    volume_list = client.get_volumes(
-        volume_filter=VolumeFilter(
-            uuid=UUIDFilter(
-                equals=volume_uuid
+    host_uuids = list(dict.fromkeys(module.params['host_uuids']))
+
+    # the volume, host and LUN queries are independent of each other
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        volume_future = executor.submit(
+            client.get_volumes,
+            volume_filter=VolumeFilter(
+                uuid=UUIDFilter(
+                    equals=volume_uuid
+                )
+            )
+        )
+        host_future = None
+        if len(host_uuids) > 0:
+            host_future = executor.submit(
+                client.get_hosts,
+                host_filter=HostFilter(
+                    uuid=StringFilter(
+                        in_list=host_uuids
+                    )
+                )
+            )
+        lun_future = executor.submit(
+            client.get_luns,
+            lun_filter=LUNFilter(
+                volume_uuid=UUIDFilter(
+                    equals=volume_uuid
+                )
             )
         )
-    )
 
+    volume_list = volume_future.result()
     if volume_list.filtered_count == 0:
         module.fail_json(msg="Volume does not exist")
 
     # get all relevant spu serials
     # TODO: This will not work with 2 SPUs in one server
-    if len(host_uuids) > 0:
-        host_list = client.get_hosts(
-            host_filter=HostFilter(
-                uuid=StringFilter(
-                    in_list=host_uuids
-                )
-            )
-        )
+    if host_future is not None:
+        host_list = host_future.result()
 
         for host in host_list.items:
-            for spu_serial in host.spu_serials:
-                if spu_serial not in spu_serials:
-                    spu_serials.append(spu_serial)
+            spu_serials.update(dict.fromkeys(host.spu_serials))
 
-    lun_list = client.get_luns(
-        lun_filter=LUNFilter(
-            volume_uuid=UUIDFilter(
-                equals=volume_uuid
-            )
-        )
-    )
+    lun_list = lun_future.result()
 
     for lun in lun_list.items:
-        if lun.spu_serial in spu_serials:
-            spu_serials.remove(lun.spu_serial)
+        spu_serials.pop(lun.spu_serial, None)
 
     # if spu_serials length is 0, all of the exports exist
     # TODO: they could exist with a different LUN ID, but it is unsafe to change
@@ -250,7 +273,7 @@ def create_luns(module, client):
             lun_input=CreateLUNInput(
                 volume_uuid=volume_uuid,
                 lun_id=lun_id,
-                spu_serials=spu_serials,
+                spu_serials=list(spu_serials),
                 local=module.params['local'],
             )
         )
@@ -262,22 +285,23 @@ def create_luns(module, client):
     return result
 
 
+_MODULE_ARGS = dict(
+    volume_uuid=dict(required=False, type='str'),
+    lun_id=dict(required=False, type='int'),
+    lun_uuids=dict(required=False, type='list', elements='str', default=[]),
+    host_uuids=dict(required=False, type='list', elements='str', default=[]),
+    spu_serials=dict(required=False, type='list', elements='str', default=[]),
+    local=dict(required=False, type='bool', default=False),
+    state=dict(required=True, choices=['present', 'absent'])
+)
+_MODULE_ARGS.update(get_login_arguments())
+
+
 def main():
     """Main entry point"""
 
-    module_args = dict(
-        volume_uuid=dict(required=False, type='str'),
-        lun_id=dict(required=False, type='int'),
-        lun_uuids=dict(required=False, type='list', elements='str', default=[]),
-        host_uuids=dict(required=False, type='list', elements='str', default=[]),
-        spu_serials=dict(required=False, type='list', elements='str', default=[]),
-        local=dict(required=False, type='bool', default=False),
-        state=dict(required=True, choices=['present', 'absent'])
-    )
-    module_args.update(get_login_arguments())
-
     module = AnsibleModule(
-        argument_spec=module_args,
+        argument_spec=_MODULE_ARGS,
         supports_check_mode=False
     )
 
@@ -180,6 +180,29 @@ EXAMPLES = r"""
     ignore_warnings: true
     state: present
 
+- name: Create several nPods without waiting for each one to complete
+  nebulon.nebulon_on.neb_npod:
+    neb_username: nebulon_on_user
+    neb_password: nebulon_on_password
+    name: "{{ item.name }}"
+    npod_group_uuid: 4bc34bf2-3c09-49bd-85de-a03aaeb3d17f
+    spus: "{{ item.spus }}"
+    npod_template_uuid: e90cba40-805a-4bcc-8c4b-99dcf87377d3
+    state: present
+  loop: "{{ npods }}"
+  async: 3600
+  poll: 0
+  register: npod_jobs
+
+- name: Wait for the nPods to be created
+  ansible.builtin.async_status:
+    jid: "{{ item.ansible_job_id }}"
+  loop: "{{ npod_jobs.results }}"
+  register: npod_results
+  until: npod_results.finished
+  retries: 120
+  delay: 30
+
 - name: Delete existing nPod
   nebulon.nebulon_on.neb_npod:
     neb_username: nebulon_on_user
@@ -286,64 +309,75 @@ try:
         NPod,
         NPodFilter,
         StringFilter,
+        PageInput,
         NPodSpuInput,
         IPInfoConfigInput,
         CreateNPodInput,
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# ip_info_config options passed to IPInfoConfigInput by keyword
+_IP_INFO_FIELDS = (
+    'dhcp',
+    'bond_mode',
+    'interfaces',
+    'address',
+    'netmask_bits',
+    'gateway',
+    'half_duplex',
+    'speed_mb',
+    'locked_speed',
+    'mtu',
+    'bond_transmit_hash_policy',
+    'bond_mii_monitor_ms',
+    'bond_lacp_transmit_rate',
+)
+
+# allowed values for the ip_info_config options
+_BOND_MODE_CHOICES = ('BondModeNone', 'BondMode8023ad', 'BondModeBalanceALB')
+_HASH_POLICY_CHOICES = (
+    'TransmitHashPolicyLayer2',
+    'TransmitHashPolicyLayer34',
+    'TransmitHashPolicyLayer23',
+)
+_LACP_RATE_CHOICES = ('LACPTransmitRateSlow', 'LACPTransmitRateFast')
+
 
 def get_ip_info_list(ip_info_config_list):
     # type: (list) -> list[IPInfoConfigInput]
     """Retrives list of IPInfoConfigInput to be used to configure the SPUs network interfaces"""
-    ip_info_list = []
-    for ip_info in ip_info_config_list:
-        ip_info_list.append(
-            IPInfoConfigInput(
-                dhcp=ip_info['dhcp'],
-                bond_mode=ip_info['bond_mode'],
-                interfaces=ip_info['interfaces'],
-                address=ip_info['address'],
-                netmask_bits=ip_info['netmask_bits'],
-                gateway=ip_info['gateway'],
-                half_duplex=ip_info['half_duplex'],
-                speed_mb=ip_info['speed_mb'],
-                locked_speed=ip_info['locked_speed'],
-                mtu=ip_info['mtu'],
-                bond_transmit_hash_policy=ip_info['bond_transmit_hash_policy'],
-                bond_mii_monitor_ms=ip_info['bond_mii_monitor_ms'],
-                bond_lacp_transmit_rate=ip_info['bond_lacp_transmit_rate']
-            )
-        )
-    return ip_info_list
+    return [
+        IPInfoConfigInput(**{key: ip_info[key] for key in _IP_INFO_FIELDS})
+        for ip_info in ip_info_config_list
+    ]
 
 
 def get_spu_list(module):
     # type: (AnsibleModule) -> list[NPodSpuInput]
     """Retrive list of SPU configuration information that will be used in the new nPod."""
-    spu_list = []
-    for spu in module.params['spus']:
-        spu_list.append(
-            NPodSpuInput(
-                spu_serial=spu['spu_serial'],
-                spu_data_ips=get_ip_info_list(spu['ip_info_config'])
-            )
+    return [
+        NPodSpuInput(
+            spu_serial=spu['spu_serial'],
+            spu_data_ips=get_ip_info_list(spu['ip_info_config'])
         )
-    return spu_list
+        for spu in module.params['spus'] or ()
+    ]
 
 
 def get_npod(module, client, npod_name):
     # type: (AnsibleModule, NebPyClient, str) -> NPod
     """Get the nPod that matches the specified name"""
+    # two items are enough to detect duplicate names
     npod_list = client.get_npods(
+        page=PageInput(page=1, count=2),
         npod_filter=NPodFilter(
             name=StringFilter(
                 equals=npod_name
@@ -366,7 +400,7 @@ def delete_npod(module, client, npod_uuid):
     try:
         client.delete_npod(npod_uuid)
     except Exception as err:
-        module.fail_json(msg=str(err))
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
     result['changed'] = True
     return result
@@ -379,62 +413,62 @@ def create_npod(module, client):
         changed=False,
         npod=None,
     )
+    params = module.params
+    spus = get_spu_list(module)
     try:
         new_npod = client.create_npod(
             create_npod_input=CreateNPodInput(
-                name=module.params['name'],
-                npod_group_uuid=module.params['npod_group_uuid'],
-                spus=get_spu_list(module),
-                npod_template_uuid=module.params['npod_template_uuid'],
-                note=module.params['note'],
-                timezone=module.params['timezone']
+                name=params['name'],
+                npod_group_uuid=params['npod_group_uuid'],
+                spus=spus,
+                npod_template_uuid=params['npod_template_uuid'],
+                note=params['note'],
+                timezone=params['timezone']
             ),
-            ignore_warnings=module.params['ignore_warnings']
+            ignore_warnings=params['ignore_warnings']
         )
     except Exception as err:
-        module.fail_json(msg=str(err))
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
     result['changed'] = True
     result['npod'] = to_dict(new_npod)
     return result
 
 
-def main():
-    module_args = dict(
-        name=dict(required=True, type='str'),
-        npod_group_uuid=dict(required=False, type='str'),
-        spus=dict(required=False, type='list', elements='dict', options=dict(
-            spu_serial=dict(required=False, type='str'),
-            ip_info_config=dict(required=False, type='list', elements='dict', options=dict(
-                dhcp=dict(required=False, type='bool'),
-                bond_mode=dict(required=False, choices=[
-                               'BondModeNone', 'BondMode8023ad', 'BondModeBalanceALB'], default='BondMode8023ad'),
-                interfaces=dict(required=False, type='list', elements='str'),
-                address=dict(required=False, type='str'),
-                netmask_bits=dict(required=False, type='int', default=0),
-                gateway=dict(required=False, type='str'),
-                half_duplex=dict(required=False, type='bool', default=False),
-                speed_mb=dict(required=False, type='int'),
-                locked_speed=dict(required=False, type='bool'),
-                mtu=dict(required=False, type='int'),
-                bond_transmit_hash_policy=dict(required=False, choices=['TransmitHashPolicyLayer2',
-                                                                        'TransmitHashPolicyLayer34',
-                                                                        'TransmitHashPolicyLayer23'], default='TransmitHashPolicyLayer34'),
-                bond_mii_monitor_ms=dict(required=False, type='int'),
-                bond_lacp_transmit_rate=dict(required=False, choices=[
-                                             'LACPTransmitRateSlow', 'LACPTransmitRateFast'], default='LACPTransmitRateFast'),
-            ))
-        )),
-        npod_template_uuid=dict(required=False, type='str'),
-        note=dict(required=False, type='str'),
-        timezone=dict(required=False, type='str', default=None),
-        ignore_warnings=dict(required=False, type='bool', default=False),
-        state=dict(required=True, choices=['present', 'absent']),
-    )
-    module_args.update(get_login_arguments())
+_MODULE_ARGS = dict(
+    name=dict(required=True, type='str'),
+    npod_group_uuid=dict(required=False, type='str'),
+    spus=dict(required=False, type='list', elements='dict', options=dict(
+        spu_serial=dict(required=False, type='str'),
+        ip_info_config=dict(required=False, type='list', elements='dict', options=dict(
+            dhcp=dict(required=False, type='bool'),
+            bond_mode=dict(required=False, choices=_BOND_MODE_CHOICES, default='BondMode8023ad'),
+            interfaces=dict(required=False, type='list', elements='str'),
+            address=dict(required=False, type='str'),
+            netmask_bits=dict(required=False, type='int', default=0),
+            gateway=dict(required=False, type='str'),
+            half_duplex=dict(required=False, type='bool', default=False),
+            speed_mb=dict(required=False, type='int'),
+            locked_speed=dict(required=False, type='bool'),
+            mtu=dict(required=False, type='int'),
+            bond_transmit_hash_policy=dict(required=False, choices=_HASH_POLICY_CHOICES,
+                                           default='TransmitHashPolicyLayer34'),
+            bond_mii_monitor_ms=dict(required=False, type='int'),
+            bond_lacp_transmit_rate=dict(required=False, choices=_LACP_RATE_CHOICES, default='LACPTransmitRateFast'),
+        ))
+    )),
+    npod_template_uuid=dict(required=False, type='str'),
+    note=dict(required=False, type='str'),
+    timezone=dict(required=False, type='str', default=None),
+    ignore_warnings=dict(required=False, type='bool', default=False),
+    state=dict(required=True, choices=['present', 'absent']),
+)
+_MODULE_ARGS.update(get_login_arguments())
 
+
+def main():
     module = AnsibleModule(
-        argument_spec=module_args,
+        argument_spec=_MODULE_ARGS,
         supports_check_mode=False
     )
 
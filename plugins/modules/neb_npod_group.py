@@ -131,24 +131,30 @@ try:
         NPodGroup,
         NPodGroupFilter,
         StringFilter,
+        PageInput,
         CreateNPodGroupInput,
         UpdateNPodGroupInput,
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# nPod group properties that can be changed with update_npod_group
+_MUTABLE_FIELDS = ('name', 'note')
+
 
 def get_npod_group(module, client, group_name):
     # type: (AnsibleModule, NebPyClient, str) -> NPodGroup
     """Get the nPod group that match the specified npod group name"""
+    # two items are enough to detect duplicate names
     npod_group_list = client.get_npod_groups(
+        page=PageInput(page=1, count=2),
         npod_group_filter=NPodGroupFilter(
             name=StringFilter(
                 equals=group_name
@@ -172,7 +178,7 @@ def delete_npod_group(module, client, npod_group_uuid):
     try:
         client.delete_npod_group(npod_group_uuid)
     except Exception as err:
-        module.fail_json(msg=str(err))
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
     result['changed'] = True
     return result
@@ -195,57 +201,51 @@ def create_npod_group(module, client):
         result['npod_group'] = to_dict(new_npod_group)
         return result
     except Exception as err:
-        module.fail_json(msg=str(err))
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
 
 def modify_npod_group(module, client, npod_group):
     # type: (AnsibleModule, NebPyClient, NPodGroup) -> dict
     """Allows modifying a nPod group"""
+    params = module.params
     result = dict(
         changed=False
     )
-    should_update = False
-    for key in module.params:
-        try:
-            if module.params[key] is None:
-                continue
-            should_update = getattr(npod_group, key) != module.params[key]
-            if should_update:
-                break
-        except AttributeError:
-            should_update = False
-
-    if should_update:
-        try:
-            modified_npod_group = client.update_npod_group(
-                uuid=npod_group.uuid,
-                update_npod_group_input=UpdateNPodGroupInput(
-                    name=module.params['name'],
-                    note=module.params['note'],
-                )
-            )
-            result['changed'] = True
-            result['npod_group'] = to_dict(modified_npod_group)
-            return result
-        except Exception as err:
-            module.fail_json(msg=str(err))
-
-    else:
-        result['changed'] = False
+
+    # only send the properties that differ from the current nPod group
+    changes = {
+        key: params[key]
+        for key in _MUTABLE_FIELDS
+        if params[key] is not None and getattr(npod_group, key) != params[key]
+    }
+    if not changes:
         result['npod_group'] = to_dict(npod_group)
         return result
 
+    try:
+        modified_npod_group = client.update_npod_group(
+            uuid=npod_group.uuid,
+            update_npod_group_input=UpdateNPodGroupInput(**changes)
+        )
+    except Exception as err:
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
-def main():
-    module_args = dict(
-        name=dict(required=True, type='str'),
-        note=dict(required=False, type='str'),
-        state=dict(required=True, choices=['present', 'absent'])
-    )
-    module_args.update(get_login_arguments())
+    result['changed'] = True
+    result['npod_group'] = to_dict(modified_npod_group)
+    return result
 
+
+_MODULE_ARGS = dict(
+    name=dict(required=True, type='str'),
+    note=dict(required=False, type='str'),
+    state=dict(required=True, choices=['present', 'absent'])
+)
+_MODULE_ARGS.update(get_login_arguments())
+
+
+def main():
     module = AnsibleModule(
-        argument_spec=module_args,
+        argument_spec=_MODULE_ARGS,
         supports_check_mode=False
     )
 
@@ -97,13 +97,13 @@ npod_groups:
       returned: always
 """
 
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.login_utils import (
     get_client,
     get_login_arguments,
 )
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils import (
+    iter_pages,
     to_dict,
     validate_sdk,
 )
@@ -119,50 +119,68 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# number of result pages that are requested concurrently
+_PAGE_PREFETCH = 8
+
 
 def get_npod_groups(client, name, uuid):
     # type: (NebPyClient, str, str) -> list
-    npod_group_info_list = []
-    page_number = 1
-    while True:
+
+    # only filter by the provided properties; the filter is the same for
+    # every page, so it is built only once
+    npod_group_filter = None
+    if uuid is not None:
+        npod_group_filter = NPodGroupFilter(
+            uuid=UUIDFilter(
+                equals=uuid
+            )
+        )
+    if name is not None:
+        npod_group_filter = NPodGroupFilter(
+            name=StringFilter(
+                equals=name
+            ),
+            and_filter=npod_group_filter,
+        )
+
+    # a uuid matches at most one nPod group, so a single item is requested
+    if uuid is not None:
         npod_group_list = client.get_npod_groups(
+            page=PageInput(page=1, count=1),
+            npod_group_filter=npod_group_filter,
+        )
+        return [to_dict(i) for i in npod_group_list.items]
+
+    def get_page(page_number):
+        return client.get_npod_groups(
             page=PageInput(page=page_number),
-            npod_group_filter=NPodGroupFilter(
-                name=StringFilter(
-                    equals=name
-                ),
-                and_filter=NPodGroupFilter(
-                    uuid=UUIDFilter(
-                        equals=uuid
-                    )
-                )
-            )
+            npod_group_filter=npod_group_filter,
         )
-        for i in range(len(npod_group_list.items)):
-            npod_group_info_list.append(to_dict(npod_group_list.items[i]))
-        if not npod_group_list.more:
-            break
-        page_number += 1
+
+    npod_group_info_list = []
+    for npod_group_list in iter_pages(get_page, _PAGE_PREFETCH):
+        npod_group_info_list.extend(map(to_dict, npod_group_list.items))
     return npod_group_info_list
 
 
-def main():
-    module_args = dict(
-        name=dict(required=False, type='str'),
-        uuid=dict(required=False, type='str'),
-    )
-    module_args.update(get_login_arguments())
+_MODULE_ARGS = dict(
+    name=dict(required=False, type='str'),
+    uuid=dict(required=False, type='str'),
+)
+_MODULE_ARGS.update(get_login_arguments())
 
+
+def main():
     module = AnsibleModule(
-        argument_spec=module_args,
+        argument_spec=_MODULE_ARGS,
         supports_check_mode=True,
     )
 
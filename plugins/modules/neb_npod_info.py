@@ -53,7 +53,35 @@ EXAMPLES = r"""
   nebulon.nebulon_on.neb_npod_info:
     neb_username: nebulon_on_user
     neb_password: nebulon_on_password
+  register: all_npods
 
+- name: Look up nPods from the registered list instead of querying each one
+  ansible.builtin.debug:
+    msg: "{{ all_npods.npods | selectattr('name', 'equalto', item) | first }}"
+  loop:
+    - my_pod
+    - my_other_pod
+
+- name: Start independent lookups without waiting for each one
+  nebulon.nebulon_on.neb_npod_info:
+    neb_username: nebulon_on_user
+    neb_password: nebulon_on_password
+    uuid: "{{ item }}"
+  loop:
+    - a9a7b8e8-3c38-4c79-9f7b-6e0a2c1d4f55
+    - 0c2c8a4e-2b3f-4a57-8d5c-7f0d1e2a3b4c
+  async: 60
+  poll: 0
+  register: lookup_jobs
+
+- name: Collect the lookup results
+  ansible.builtin.async_status:
+    jid: "{{ item.ansible_job_id }}"
+  loop: "{{ lookup_jobs.results }}"
+  register: lookups
+  until: lookups.finished
+  retries: 30
+  delay: 2
 """
 
 RETURN = r"""
@@ -138,13 +166,13 @@ npods:
       returned: always
 """
 
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.login_utils import (
     get_client,
     get_login_arguments,
 )
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils import (
+    iter_pages,
     to_dict,
     validate_sdk,
 )
@@ -156,54 +184,72 @@ try:
         NPodFilter,
         StringFilter,
         UUIDFilter,
+        PageInput,
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# number of nPods requested per page; the SDK default is 100
+_PAGE_SIZE = 500
+
+# number of result pages that are requested concurrently
+_PAGE_PREFETCH = 8
+
 
 def get_npod_list(module, client):
     # type: (AnsibleModule, NebPyClient) -> list
     """Retrieves a list of nPods that matches the specified filter"""
-    npods = []
-    page_number = 1
-    while True:
-        npod_list = client.get_npods(
-            npod_filter=NPodFilter(
-                name=StringFilter(
-                    equals=module.params['name']
-                ),
-                and_filter=NPodFilter(
-                    uuid=UUIDFilter(
-                        equals=module.params['uuid']
-                    )
-                )
+
+    # the filter is the same for every page, so it is built only once
+    npod_filter = NPodFilter(
+        name=StringFilter(
+            equals=module.params['name']
+        ),
+        and_filter=NPodFilter(
+            uuid=UUIDFilter(
+                equals=module.params['uuid']
             )
         )
-        for i in range(len(npod_list.items)):
-            npods.append(to_dict(npod_list.items[i]))
-        if not npod_list.more:
-            break
-        page_number += 1
+    )
+
+    # a uuid matches at most one nPod, so there is no further page
+    if module.params['uuid'] is not None:
+        npod_list = client.get_npods(
+            page=PageInput(page=1, count=1),
+            npod_filter=npod_filter,
+        )
+        return [to_dict(i) for i in npod_list.items]
 
+    def get_page(page_number):
+        return client.get_npods(
+            page=PageInput(page=page_number, count=_PAGE_SIZE),
+            npod_filter=npod_filter,
+        )
+
+    # the page count is derived from filtered_count of the first page
+    npods = []
+    for npod_list in iter_pages(get_page, _PAGE_PREFETCH):
+        npods.extend(map(to_dict, npod_list.items))
     return npods
 
 
-def main():
-    module_args = dict(
-        name=dict(required=False, type='str'),
-        uuid=dict(required=False, type='str'),
-    )
-    module_args.update(get_login_arguments())
+_MODULE_ARGS = dict(
+    name=dict(required=False, type='str'),
+    uuid=dict(required=False, type='str'),
+)
+_MODULE_ARGS.update(get_login_arguments())
 
+
+def main():
     module = AnsibleModule(
-        argument_spec=module_args,
+        argument_spec=_MODULE_ARGS,
         supports_check_mode=True,
     )
 
@@ -223,14 +223,41 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# module parameters compared against the nPod template to detect changes
+_COMPARABLE = (
+    'saving_factor',
+    'mirrored_volume',
+    'boot_volume',
+    'os',
+    'volume_size_bytes',
+    'shared_volume',
+    'boot_volume_size_bytes',
+    'boot_image_url',
+    'app',
+    'note',
+    'snapshot_schedule_template_uuids',
+    'volume_count',
+)
+
+# module parameters that are named differently on the nPod template
+_ALIAS = {
+    'shared_volume': 'shared_lun',
+}
+
+
+def _get_input_args(params):
+    # type: (dict) -> dict
+    """Maps the nPod template module parameters to SDK input arguments"""
+    return {_ALIAS.get(key, key): params[key] for key in _COMPARABLE}
+
 
 def get_npod_template(client, name):
     # type: (NebPyClient, str) -> NPodTemplate
@@ -239,17 +266,14 @@ def get_npod_template(client, name):
         template_filter=NPodTemplateFilter(
             name=StringFilter(
                 equals=name
-            )
+            ),
+            and_filter=NPodTemplateFilter(
+                only_last_version=True,
+            ),
         )
     )
-    npod_template = None
     if template_list.filtered_count > 0:
-        npod_template = template_list.items[0]
-    # TODO: To be removed once the SDK accepts the lastVersion flag to retrieve the last version of the template.
-    for i in range(1, template_list.filtered_count):
-        if template_list.items[i].version > npod_template.version:
-            npod_template = template_list.items[i]
-    return npod_template
+        return template_list.items[0]
 
 
 def delete_npod_template(module, client, parent_uuid):
@@ -261,7 +285,7 @@ def delete_npod_template(module, client, parent_uuid):
     try:
         client.delete_npod_template(parent_uuid)
     except Exception as err:
-        module.fail_json(msg=str(err))
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
     result['changed'] = True
     return result
@@ -278,22 +302,11 @@ def create_npod_template(module, client):
         new_npod_template = client.create_npod_template(
             create_npod_template_input=CreateNPodTemplateInput(
                 name=module.params['name'],
-                saving_factor=module.params['saving_factor'],
-                mirrored_volume=module.params['mirrored_volume'],
-                boot_volume=module.params['boot_volume'],
-                os=module.params['os'],
-                volume_size_bytes=module.params['volume_size_bytes'],
-                shared_lun=module.params['shared_volume'],
-                boot_volume_size_bytes=module.params['boot_volume_size_bytes'],
-                boot_image_url=module.params['boot_image_url'],
-                app=module.params['app'],
-                note=module.params['note'],
-                snapshot_schedule_template_uuids=module.params['snapshot_schedule_template_uuids'],
-                volume_count=module.params['volume_count'],
+                **_get_input_args(module.params)
             )
         )
     except Exception as err:
-        module.fail_json(msg=str(err))
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
     result['changed'] = True
     result['npod_template'] = to_dict(new_npod_template)
@@ -307,45 +320,35 @@ def modify_npod_template(module, client, npod_template):
         changed=False,
         npod_template=None,
     )
-    should_update = False
-    for key in module.params:
-        try:
-            if module.params[key] is None:
-                continue
-            should_update = getattr(npod_template, key) != module.params[key]
-            if should_update:
-                break
-        except AttributeError:
-            should_update = False
-
-    if should_update:
-        try:
-            modified_npod_template = client.update_npod_template(
-                update_npod_template_input=UpdateNPodTemplateInput(
-                    name=module.params['name'],
-                    saving_factor=module.params['saving_factor'],
-                    mirrored_volume=module.params['mirrored_volume'],
-                    boot_volume=module.params['boot_volume'],
-                    os=module.params['os'],
-                    volume_size_bytes=module.params['volume_size_bytes'],
-                    shared_lun=module.params['shared_volume'],
-                    boot_volume_size_bytes=module.params['boot_volume_size_bytes'],
-                    boot_image_url=module.params['boot_image_url'],
-                    app=module.params['app'],
-                    note=module.params['note'],
-                    snapshot_schedule_template_uuids=module.params['snapshot_schedule_template_uuids'],
-                    volume_count=module.params['volume_count']
-                )
-            )
-            result['changed'] = True
-            result['npod_template'] = to_dict(modified_npod_template)
-        except Exception as err:
-            module.fail_json(msg=str(err))
+    params = module.params
+
+    # the converted template is compared and returned when it is unchanged,
+    # so it is only converted once
+    current = to_dict(npod_template)
+
+    # only send the properties that differ from the current template, so
+    # that unchanged values are not resubmitted with the new version
+    changes = {
+        key: value
+        for key, value in _get_input_args(params).items()
+        if value is not None and current.get(key) != value
+    }
+    if not changes:
+        result['npod_template'] = current
+        return result
 
-    else:
-        result['changed'] = False
-        result['npod_template'] = to_dict(npod_template)
+    try:
+        modified_npod_template = client.update_npod_template(
+            update_npod_template_input=UpdateNPodTemplateInput(
+                name=params['name'],
+                **changes
+            )
+        )
+    except Exception as err:
+        module.fail_json(msg=str(err), exception=traceback.format_exc())
 
+    result['changed'] = True
+    result['npod_template'] = to_dict(modified_npod_template)
     return result
 
 
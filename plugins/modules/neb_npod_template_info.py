@@ -67,6 +67,34 @@ EXAMPLES = r"""
   nebulon.nebulon_on.neb_npod_template_info:
     neb_username: nebulon_on_user
     neb_password: nebulon_on_password
+  register: all_npod_templates
+
+- name: Look up nPod templates from the registered list instead of querying each one
+  ansible.builtin.debug:
+    msg: "{{ all_npod_templates.npod_templates | selectattr('uuid', 'equalto', item) | first }}"
+  loop:
+    - 041e6d6e-5e45-4881-859d-98bda749c173
+
+- name: Start independent lookups without waiting for each one
+  nebulon.nebulon_on.neb_npod_template_info:
+    neb_username: nebulon_on_user
+    neb_password: nebulon_on_password
+    uuid: "{{ item }}"
+  loop:
+    - 041e6d6e-5e45-4881-859d-98bda749c173
+    - 6f1d3a2b-8c4e-4f5a-9b7c-2d1e0f3a4b5c
+  async: 60
+  poll: 0
+  register: lookup_jobs
+
+- name: Collect the lookup results
+  ansible.builtin.async_status:
+    jid: "{{ item.ansible_job_id }}"
+  loop: "{{ lookup_jobs.results }}"
+  register: lookups
+  until: lookups.finished
+  retries: 30
+  delay: 2
 """
 
 RETURN = r"""
@@ -147,13 +175,13 @@ npod_templates:
       returned: always
 """
 
-import traceback
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.login_utils import (
     get_client,
     get_login_arguments,
 )
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils import (
+    iter_pages,
     to_dict,
     validate_sdk,
 )
@@ -169,79 +197,90 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
     NEBULON_IMPORT_ERROR = None
 
+# number of nPod templates requested per page; the SDK default is 100
+_PAGE_SIZE = 500
+
+# number of result pages that are requested concurrently
+_PAGE_PREFETCH = 8
+
+
+# optional module parameters that are matched exactly
+_FILTER_PARAMS = ('app', 'os')
+
+
+def _build_template_filter(params, **predicate):
+    # type: (dict, any) -> NPodTemplateFilter
+    """Builds the nPod template filter for the provided module parameters"""
+
+    # a filter only allows one property, so the version flag, every provided
+    # optional parameter and the predicate are chained with and_filter
+    template_filter = NPodTemplateFilter(
+        only_last_version=params['only_last_version'],
+    )
+    for field in reversed(_FILTER_PARAMS):
+        value = params[field]
+        if value is not None:
+            template_filter = NPodTemplateFilter(
+                and_filter=template_filter,
+                **{field: StringFilter(equals=value)}
+            )
+    if predicate:
+        template_filter = NPodTemplateFilter(
+            and_filter=template_filter,
+            **predicate
+        )
+    return template_filter
+
 
 def get_npod_template_by_uuid(module, client):
     # type: (AnsibleModule, NebPyClient) -> list[dict]
     """Get the nPod template that matches the specified UUID"""
     template_list = client.get_npod_templates(
-        template_filter=NPodTemplateFilter(
+        template_filter=_build_template_filter(
+            module.params,
             uuid=UUIDFilter(
                 equals=module.params['uuid']
             ),
-            and_filter=NPodTemplateFilter(
-                app=StringFilter(
-                    equals=module.params['app']
-                ),
-                and_filter=NPodTemplateFilter(
-                    os=StringFilter(
-                        equals=module.params['os']
-                    ),
-                    and_filter=NPodTemplateFilter(
-                        only_last_version=module.params['only_last_version'],
-                    )
-                )
-            )
         )
     )
     if template_list.filtered_count > 1:
         module.fail_json(
             msg=f"Found more than one nPod template with uuid {module.params['uuid']}."
         )
-    elif template_list.filtered_count == 1:
-        return [to_dict(template_list.items[0])]
+    return [to_dict(i) for i in template_list.items]
 
 
 def get_npod_template(module, client):
     # type: (AnsibleModule, NebPyClient) -> list[dict]
     """Get the nPod template that matches the specified UUID"""
-    templates = []
-    page_number = 1
-    while True:
-        template_list = client.get_npod_templates(
-            page=PageInput(page=page_number),
-            template_filter=NPodTemplateFilter(
-                name=StringFilter(
-                    equals=module.params['name']
-                ),
-                and_filter=NPodTemplateFilter(
-                    app=StringFilter(
-                        equals=module.params['app']
-                    ),
-                    and_filter=NPodTemplateFilter(
-                        os=StringFilter(
-                            equals=module.params['os']
-                        ),
-                        and_filter=NPodTemplateFilter(
-                            only_last_version=module.params['only_last_version'],
-                        )
-                    )
-                )
-            )
+
+    # only filter by name if it is provided; the filter is the same for
+    # every page, so it is built only once
+    predicate = {}
+    if module.params['name'] is not None:
+        predicate['name'] = StringFilter(
+            equals=module.params['name']
         )
-        for i in range(len(template_list.items)):
-            templates.append(to_dict(template_list.items[i]))
-        if not template_list.more:
-            break
-        page_number += 1
+    template_filter = _build_template_filter(module.params, **predicate)
 
+    def get_page(page_number):
+        return client.get_npod_templates(
+            page=PageInput(page=page_number, count=_PAGE_SIZE),
+            template_filter=template_filter,
+        )
+
+    # the page count is derived from filtered_count of the first page
+    templates = []
+    for template_list in iter_pages(get_page, _PAGE_PREFETCH):
+        templates.extend(map(to_dict, template_list.items))
     return templates
 
 
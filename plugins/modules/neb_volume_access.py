@@ -126,7 +126,6 @@ host_uuids:
 
 
 # pylint: disable=wrong-import-position,no-name-in-module,import-error
-import traceback
 import time
 from typing import List
 from ansible.module_utils.basic import AnsibleModule
@@ -152,9 +151,9 @@ try:
         __version__,
     )
 
-except ImportError:
+except ImportError as err:
     NEBULON_SDK_VERSION = None
-    NEBULON_IMPORT_ERROR = traceback.format_exc()
+    NEBULON_IMPORT_ERROR = err
 
 else:
     NEBULON_SDK_VERSION = __version__.strip()
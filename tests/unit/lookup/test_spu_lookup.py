@@ -122,6 +122,19 @@ class TestSPULookupModule(unittest.TestCase):
         except AnsibleError:
             pass
 
+    def test_invalid_host_group_after_valid_group(self):
+        """Test for an error when any of the provided host groups is invalid"""
+        with self.assertRaises(AnsibleError):
+            self.module.run(
+                terms=["lacp", "invalid_host_group"], variables=mock_vars,
+            )
+
+    def test_duplicate_host_group(self):
+        """Test that a host group provided twice is only processed once"""
+        result = self.module.run(terms=["lacp", "lacp"], variables=mock_vars)
+
+        self.assertEqual(len(mock_vars["groups"]["lacp"]), len(result))
+
     def test_create_nobond_configuration_from_hostvars(self):
         """Test lookup of configuration without a bonded configuration"""
 
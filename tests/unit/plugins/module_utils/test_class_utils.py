@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+from enum import Enum
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.module_utils.class_utils import (
+    to_dict,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+# The following classes mimic the structure of objects returned by the
+# Nebulon Python SDK, which store their properties in name-mangled fields.
+
+class MockMode(Enum):
+    FAST = "Fast"
+    SLOW = "Slow"
+
+
+class MockChild:
+    def __init__(self, name):
+        self.__name = name
+
+
+class MockParent:
+    def __init__(self, children, mode=MockMode.FAST):
+        self.__uuid = "5a4f0d42-5e6a-4b5e-8b4c-3c1f0a1b2c3d"
+        self.__mode = mode
+        self.__children = children
+        self.__first = children[0] if len(children) > 0 else None
+        self.__tags = ["a", "b"]
+
+
+class MockNode:
+    def __init__(self, child):
+        self.__child = child
+
+
+class TestToDict(unittest.TestCase):
+    """Test class for converting SDK objects to dictionaries"""
+
+    def test_primitive(self):
+        """Values without attributes are returned unchanged"""
+        self.assertEqual(1, to_dict(1))
+        self.assertEqual("value", to_dict("value"))
+        self.assertIsNone(to_dict(None))
+
+    def test_nested_object(self):
+        """Nested objects, lists and Enums are converted"""
+        parent = MockParent([MockChild("child1"), MockChild("child2")])
+
+        result = to_dict(parent)
+
+        self.assertEqual(
+            {
+                "uuid": "5a4f0d42-5e6a-4b5e-8b4c-3c1f0a1b2c3d",
+                "mode": "Fast",
+                "children": [{"name": "child1"}, {"name": "child2"}],
+                "first": {"name": "child1"},
+                "tags": ["a", "b"],
+            },
+            result,
+        )
+
+    def test_field_order(self):
+        """Converted fields keep the order of the source object"""
+        result = to_dict(MockParent([], mode=MockMode.SLOW))
+
+        self.assertEqual(
+            ["uuid", "mode", "children", "first", "tags"],
+            list(result.keys()),
+        )
+        self.assertEqual("Slow", result["mode"])
+        self.assertIsNone(result["first"])
+
+    def test_deep_nesting(self):
+        """Deeply nested objects don't exhaust the interpreter stack"""
+        node = MockChild("leaf")
+        for _ in range(5000):
+            node = MockNode(node)
+
+        result = to_dict(node)
+
+        for _ in range(5000):
+            result = result["child"]
+        self.assertEqual({"name": "leaf"}, result)
+
+    def test_deep_list_nesting(self):
+        """Objects nested through lists don't exhaust the interpreter stack"""
+        node = MockChild("leaf")
+        for _ in range(5000):
+            node = MockParent([node])
+
+        result = to_dict(node)
+
+        for _ in range(5000):
+            self.assertIs(result["first"], result["children"][0])
+            result = result["children"][0]
+        self.assertEqual({"name": "leaf"}, result)
+
+    def test_shared_object(self):
+        """Objects referenced more than once are converted once"""
+        child = MockChild("child1")
+        parent = MockParent([child])
+
+        result = to_dict(parent)
+
+        self.assertEqual({"name": "child1"}, result["first"])
+        self.assertIs(result["first"], result["children"][0])
+
+    def test_results_per_call(self):
+        """Each call builds new dicts from the current state of the object"""
+        parent = MockParent([MockChild("child1")])
+
+        first = to_dict(parent)
+        first["tags"].append("c")
+        parent._MockParent__note = "changed"
+        second = to_dict(parent)
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(first["first"], second["first"])
+        self.assertEqual(["a", "b"], second["tags"])
+        self.assertEqual("changed", second["note"])
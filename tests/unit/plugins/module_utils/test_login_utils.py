@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+from unittest import mock
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.module_utils import login_utils
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockModule:
+    ansible_version = '2.14.0'
+
+    def __init__(self, username, password):
+        self.params = dict(
+            neb_username=username,
+            neb_password=password,
+        )
+
+    def fail_json(self, **kwargs):
+        raise SystemExit(1)
+
+
+class MockSession:
+    def __init__(self):
+        self.hooks = dict(response=[])
+
+
+class MockResponse:
+    content = b'{"data": {"value": 1}}'
+
+    def json(self, **kwargs):
+        raise AssertionError("response.json was not replaced")
+
+
+class MockClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.session = MockSession()
+
+
+class TestGetClient(unittest.TestCase):
+    """Test class for logging in to nebulon ON"""
+
+    def setUp(self):
+        patcher = mock.patch.object(login_utils, 'NebPyClient', MockClient)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_credentials(self):
+        """Clients log in with the module's credentials and version"""
+        client = login_utils.get_client(MockModule('user', 'password'))
+
+        self.assertEqual('user', client.kwargs['username'])
+        self.assertEqual('password', client.kwargs['password'])
+        self.assertEqual(
+            f"2.14.0,{login_utils.COLLECTION_VERSION}", client.kwargs['client_version'])
+
+    @unittest.skipIf(login_utils._orjson_loads is None, "orjson is not installed")
+    def test_orjson_responses(self):
+        """Responses of the client's session are parsed with orjson"""
+        client = login_utils.get_client(MockModule('user', 'password'))
+
+        response = MockResponse()
+        for hook in client.session.hooks['response']:
+            response = hook(response)
+
+        self.assertEqual({"data": {"value": 1}}, response.json())
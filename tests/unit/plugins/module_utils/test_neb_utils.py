@@ -23,6 +23,10 @@ import unittest
 
 # pylint: disable=import-error,no-name-in-module
 from ansible_collections.nebulon.nebulon_on.plugins.module_utils.neb_utils import (
+    get_npod,
+    get_npods,
+    get_volumes,
+    iter_pages,
     validate_sdk,
 )
 # pylint: enable=import-error,no-name-in-module
@@ -38,6 +42,50 @@ class MockModule(dict):
         self.failed = True
 
 
+class MockExitModule(MockModule):
+    """Exits on failure like an Ansible module and keeps the failure details"""
+
+    def fail_json(self, **kwargs):
+        self.failed = True
+        self.update(kwargs)
+        raise SystemExit(1)
+
+
+class MockItem:
+    def __init__(self, uuid):
+        self.uuid = uuid
+
+
+class MockItemList:
+    def __init__(self, items, more=False):
+        self.items = items
+        self.filtered_count = len(items)
+        self.more = more
+
+
+class MockClient:
+    """Mocks a Nebulon ON client that knows a fixed set of nPods"""
+
+    def __init__(self, uuids):
+        self.uuids = uuids
+        self.calls = 0
+        self.requested = []
+
+    def get_npods(self, page=None, npod_filter=None):
+        self.calls += 1
+        self.requested = npod_filter.uuid.in_filter
+        return MockItemList(
+            [MockItem(uuid) for uuid in self.uuids if uuid in self.requested]
+        )
+
+    def get_volumes(self, page=None, volume_filter=None):
+        self.calls += 1
+        self.requested = volume_filter.uuid.in_filter
+        return MockItemList(
+            [MockItem(uuid) for uuid in self.uuids if uuid in self.requested]
+        )
+
+
 class TestLibraryCheck(unittest.TestCase):
     """Test class to validate nebpyclient library version checks"""
 
@@ -71,6 +119,20 @@ class TestLibraryCheck(unittest.TestCase):
         )
         self.assertFalse(mock_module.failed)
 
+    def test_version_exact_no_prefix_match(self):
+        """An exact version doesn't match versions it is a prefix of"""
+        version = '1.0.10'
+        supported_versions = [
+            '1.0.1'
+        ]
+        mock_module = MockModule()
+        validate_sdk(
+            module=mock_module,
+            version=version,
+            ok_versions=supported_versions
+        )
+        self.assertTrue(mock_module.failed)
+
     def test_version_range(self):
         """A test to check version in a range"""
         version = '1.0.0'
@@ -85,6 +147,27 @@ class TestLibraryCheck(unittest.TestCase):
         )
         self.assertFalse(mock_module.failed)
 
+    def test_version_range_multi_digit(self):
+        """A test to check that ranges compare whole numbers"""
+        supported_versions = [
+            '1.0.[1-2]'
+        ]
+        mock_module = MockModule()
+        validate_sdk(
+            module=mock_module,
+            version='1.0.10',
+            ok_versions=supported_versions
+        )
+        self.assertTrue(mock_module.failed)
+
+        mock_module = MockModule()
+        validate_sdk(
+            module=mock_module,
+            version='1.0.2',
+            ok_versions=supported_versions
+        )
+        self.assertFalse(mock_module.failed)
+
     def test_version_wildcard(self):
         """A test to check for a wildcard pattern"""
         version = '1.0.0'
@@ -113,6 +196,24 @@ class TestLibraryCheck(unittest.TestCase):
         )
         self.assertTrue(mock_module.failed)
 
+    def test_missing_sdk(self):
+        """A test to check that a missing SDK reports the import error"""
+        try:
+            raise ImportError("No module named 'nebpyclient'")
+        except ImportError as err:
+            import_error = err
+
+        mock_module = MockExitModule()
+        with self.assertRaises(SystemExit):
+            validate_sdk(
+                module=mock_module,
+                version=None,
+                import_error=import_error,
+            )
+        self.assertTrue(mock_module.failed)
+        self.assertEqual("ImportError", mock_module['error_class'])
+        self.assertIn("Traceback", mock_module['error_details'])
+
     def test_invalid_version_pattern(self):
         """A test to check that an error is raised for invalid versions"""
 
@@ -150,3 +251,73 @@ class TestLibraryCheck(unittest.TestCase):
 
         except ValueError:
             pass
+
+
+class TestBatchLookup(unittest.TestCase):
+    """Test class to validate batched nPod and volume lookups"""
+
+    def test_get_npods_single_query(self):
+        """Multiple nPods are looked up with a single query"""
+        client = MockClient(["npod1", "npod2", "npod3"])
+
+        result = get_npods(client, ["npod1", "npod3", "npod4"])
+
+        self.assertEqual(1, client.calls)
+        self.assertEqual(["npod1", "npod3"], sorted(result.keys()))
+
+    def test_get_npod_not_found(self):
+        """An error is raised when a nPod can't be found"""
+        client = MockClient(["npod1"])
+
+        self.assertEqual("npod1", get_npod(client, "npod1").uuid)
+
+        with self.assertRaises(Exception):
+            get_npod(client, "npod2")
+
+    def test_get_volumes_single_query(self):
+        """Multiple volumes are looked up with a single query"""
+        client = MockClient(["volume1", "volume2"])
+
+        result = get_volumes(client, ["volume1", "volume2", "volume1"])
+
+        self.assertEqual(1, client.calls)
+        self.assertEqual(["volume1", "volume2"], client.requested)
+        self.assertEqual(["volume1", "volume2"], sorted(result.keys()))
+
+
+class TestIterPages(unittest.TestCase):
+    """Test class to validate paginated queries"""
+
+    @staticmethod
+    def get_pages(total, page_size=10):
+        requested = []
+
+        def get_page(page_number):
+            requested.append(page_number)
+            start = (page_number - 1) * page_size
+            page = MockItemList(
+                [MockItem(i) for i in range(start, min(total, start + page_size))],
+                more=start + page_size < total,
+            )
+            page.filtered_count = total
+            return page
+
+        pages = list(iter_pages(get_page))
+        return pages, requested
+
+    def test_single_page(self):
+        """A single page is requested when all items fit"""
+        pages, requested = self.get_pages(5)
+
+        self.assertEqual([1], requested)
+        self.assertEqual(1, len(pages))
+
+    def test_pages_in_order(self):
+        """All pages are returned in order"""
+        pages, requested = self.get_pages(95)
+
+        self.assertEqual(list(range(1, 11)), sorted(requested))
+        self.assertEqual(
+            list(range(95)),
+            [item.uuid for page in pages for item in page.items],
+        )
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_capacity_info import (
+    _PromQLClient,
+    _get_value_from_promql,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockResponse:
+    def __init__(self, content):
+        self.content = content
+
+
+class MockSession:
+    """Mocks the requests session of a Nebulon ON client"""
+
+    def __init__(self, content):
+        self.cookies = dict()
+        self.content = content
+
+    def post(self, url=None, data=None, headers=None):
+        return MockResponse(self.content)
+
+
+class MockClient:
+    def __init__(self, content):
+        self.session = MockSession(content)
+
+
+class TestPromQLValue(unittest.TestCase):
+    """Test class for reading values from PromQL responses"""
+
+    def test_value(self):
+        """The first result value is returned rounded"""
+        data = {"status": "success", "data": {"result": [{"value": [0, "1.2345"]}]}}
+        self.assertEqual(1.23, _get_value_from_promql(data))
+
+    def test_empty_result(self):
+        """An empty result has no value"""
+        data = {"status": "success", "data": {"result": []}}
+        self.assertEqual(-1.0, _get_value_from_promql(data))
+
+    def test_error(self):
+        """An error response has no value"""
+        data = {"status": "error", "errorType": "bad_data", "error": "parse error"}
+        self.assertEqual(-1.0, _get_value_from_promql(data))
+
+    def test_null_data(self):
+        """A response without data has no value"""
+        data = {"status": "error", "data": None}
+        self.assertEqual(-1.0, _get_value_from_promql(data))
+
+    def test_query(self):
+        """Queries parse the raw response content"""
+        client = MockClient(b'{"status": "success", "data": null}')
+        self.assertEqual([-1.0, -1.0], _PromQLClient(client).query_all(['a', 'b']))
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_clone import (
+    get_clone,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockModule,
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockExitModule(MockModule):
+    """Mocks an AnsibleModule that exits on failure like the real one"""
+
+    def fail_json(self, **kwargs):
+        super().fail_json(**kwargs)
+        raise SystemExit(1)
+
+
+class MockClient:
+    """Mocks a Nebulon ON client that filters volumes on the server"""
+
+    def __init__(self, volumes):
+        self.volumes = volumes
+        self.requests = []
+
+    def get_volumes(self, page=None, volume_filter=None):
+        self.requests.append((page, volume_filter))
+        if volume_filter.uuid is not None:
+            matches = [i for i in self.volumes if i.uuid == volume_filter.uuid.equals]
+        else:
+            npod_uuid = volume_filter.and_filter.npod_uuid.equals
+            matches = [
+                i for i in self.volumes
+                if i.name == volume_filter.name.equals and i.npod_uuid == npod_uuid
+            ]
+        return MockItemList(matches, count=page.count)
+
+
+def volumes_with_clones(*clone_indexes, count=250):
+    """Returns a parent volume and same-named volumes in other nPods"""
+    volumes = [MockItem(uuid="parent", name="parent", npod_uuid="npod1")]
+    for index in range(count):
+        npod_uuid = "npod1" if index in clone_indexes else f"npod{index + 2}"
+        volumes.append(MockItem(uuid=f"volume{index}", name="clone", npod_uuid=npod_uuid))
+    return volumes
+
+
+class TestGetClone(unittest.TestCase):
+    """Test class for looking up volume clones"""
+
+    def test_clone_in_parent_npod(self):
+        """The clone is queried by name in the nPod of the parent volume"""
+        client = MockClient(volumes_with_clones(240))
+        module = MockModule()
+
+        clone = get_clone(module, client, "clone", "parent")
+
+        self.assertFalse(module.failed)
+        self.assertEqual("volume240", clone.uuid)
+        self.assertEqual([1, 1], [page.count for page, _ in client.requests])
+        clone_filter = client.requests[1][1]
+        self.assertEqual("npod1", clone_filter.and_filter.npod_uuid.equals)
+
+    def test_no_clone(self):
+        """None is returned when no volume in the parent nPod has the name"""
+        client = MockClient(volumes_with_clones())
+        module = MockModule()
+
+        self.assertIsNone(get_clone(module, client, "clone", "parent"))
+        self.assertFalse(module.failed)
+
+    def test_duplicate_clones(self):
+        """More than one clone in the parent nPod is reported"""
+        client = MockClient(volumes_with_clones(3, 7))
+        module = MockExitModule()
+
+        with self.assertRaises(SystemExit):
+            get_clone(module, client, "clone", "parent")
+
+        self.assertTrue(module.failed)
+
+    def test_missing_parent(self):
+        """An unknown parent volume is reported before the clone is queried"""
+        client = MockClient(volumes_with_clones(0))
+        module = MockExitModule()
+
+        with self.assertRaises(SystemExit):
+            get_clone(module, client, "clone", "other")
+
+        self.assertTrue(module.failed)
+        self.assertEqual(1, len(client.requests))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_host import (
+    get_host_by_spu_serial,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockClient:
+    """Mocks a Nebulon ON client with a single host and SPU"""
+
+    def __init__(self):
+        self.spu_calls = 0
+        self.host_calls = 0
+
+    def get_spus(self, spu_filter=None):
+        self.spu_calls += 1
+        if spu_filter.serial.equals != "spu1":
+            return MockItemList([])
+        return MockItemList([MockItem(serial="spu1", host_uuid="host1")])
+
+    def get_hosts(self, host_filter=None):
+        self.host_calls += 1
+        return MockItemList([MockItem(uuid="host1", name="server1")])
+
+
+class TestHostBySpuSerial(unittest.TestCase):
+    """Test class for resolving hosts by SPU serial number"""
+
+    def test_lookup(self):
+        """The host is resolved through the SPU serial number"""
+        client = MockClient()
+
+        self.assertEqual("host1", get_host_by_spu_serial(client, "spu1").uuid)
+
+        self.assertEqual(1, client.spu_calls)
+        self.assertEqual(1, client.host_calls)
+
+    def test_unknown_spu(self):
+        """An error is raised when the SPU can't be found"""
+        client = MockClient()
+
+        with self.assertRaises(Exception):
+            get_host_by_spu_serial(client, "spu2")
+
+        self.assertEqual(0, client.host_calls)
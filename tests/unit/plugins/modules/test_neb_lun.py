@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_lun import (
+    create_luns,
+    delete_luns,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockModule,
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockClient:
+    """Mocks a Nebulon ON client with one volume and a set of hosts"""
+
+    def __init__(self, hosts, luns=None):
+        self.hosts = hosts
+        self.luns = luns if luns is not None else []
+        self.created = []
+        self.deleted = []
+
+    def get_volumes(self, volume_filter=None):
+        return MockItemList([MockItem(uuid="volume1")])
+
+    def get_hosts(self, host_filter=None):
+        return MockItemList(self.hosts)
+
+    def get_luns(self, lun_filter=None):
+        return MockItemList(self.luns)
+
+    def create_lun(self, lun_input=None):
+        self.created.append(lun_input)
+
+    def delete_lun(self, lun_uuid=None):
+        self.deleted.append(lun_uuid)
+
+
+def lun_params(**params):
+    result = dict(
+        volume_uuid="volume1",
+        lun_id=None,
+        lun_uuids=[],
+        host_uuids=[],
+        spu_serials=[],
+        local=False,
+    )
+    result.update(params)
+    return result
+
+
+class TestCreateLuns(unittest.TestCase):
+    """Test class for creating LUNs"""
+
+    def test_create_single_call(self):
+        """All SPUs are exported to with a single create_lun call"""
+        client = MockClient([
+            MockItem(uuid="host1", spu_serials=["spu1", "spu2"]),
+            MockItem(uuid="host2", spu_serials=["spu3"]),
+        ])
+        module = MockModule(**lun_params(
+            host_uuids=["host1", "host2", "host1"],
+            spu_serials=["spu4"],
+        ))
+
+        result = create_luns(module, client)
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(1, len(client.created))
+        self.assertEqual(
+            ["spu4", "spu1", "spu2", "spu3"],
+            client.created[0].spu_serials,
+        )
+
+    def test_create_existing(self):
+        """No LUNs are created for SPUs that already export the volume"""
+        client = MockClient(
+            [MockItem(uuid="host1", spu_serials=["spu1"])],
+            luns=[MockItem(uuid="lun1", spu_serial="spu1")],
+        )
+        module = MockModule(**lun_params(host_uuids=["host1"]))
+
+        result = create_luns(module, client)
+
+        self.assertFalse(result['changed'])
+        self.assertEqual(0, len(client.created))
+
+
+class TestDeleteLuns(unittest.TestCase):
+    """Test class for deleting LUNs"""
+
+    def test_delete_all(self):
+        """All matching LUNs are deleted"""
+        client = MockClient([], luns=[
+            MockItem(uuid="lun1"),
+            MockItem(uuid="lun2"),
+        ])
+        module = MockModule(**lun_params(lun_uuids=["lun1", "lun2"]))
+
+        result = delete_luns(module, client)
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(["lun1", "lun2"], sorted(client.deleted))
+
+    def test_delete_nothing(self):
+        """No query is sent without LUN UUIDs"""
+        client = MockClient([], luns=[MockItem(uuid="lun1")])
+        module = MockModule(**lun_params())
+
+        result = delete_luns(module, client)
+
+        self.assertFalse(result['changed'])
+        self.assertEqual([], client.deleted)
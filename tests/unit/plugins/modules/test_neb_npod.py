@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_npod import (
+    get_npod,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockModule,
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockClient:
+    """Mocks a Nebulon ON client with a list of nPods"""
+
+    def __init__(self, npods):
+        self.npods = npods
+        self.pages = []
+
+    def get_npods(self, page=None, npod_filter=None):
+        self.pages.append(page)
+        name = npod_filter.name.equals
+        return MockItemList(
+            [i for i in self.npods if i.name == name], count=page.count)
+
+
+class TestGetNPod(unittest.TestCase):
+    """Test class for looking up nPods by name"""
+
+    def test_small_page(self):
+        """No more than two nPods are requested for a name"""
+        client = MockClient([MockItem(uuid="npod1", name="npod")])
+
+        npod = get_npod(MockModule(), client, "npod")
+
+        self.assertEqual("npod1", npod.uuid)
+        self.assertEqual(1, len(client.pages))
+        self.assertEqual(2, client.pages[0].count)
+
+    def test_missing(self):
+        """None is returned for unknown names"""
+        client = MockClient([MockItem(uuid="npod1", name="npod")])
+
+        self.assertIsNone(get_npod(MockModule(), client, "other"))
+
+    def test_duplicate(self):
+        """Duplicate names are reported"""
+        client = MockClient([
+            MockItem(uuid="npod1", name="npod"),
+            MockItem(uuid="npod2", name="npod"),
+            MockItem(uuid="npod3", name="npod"),
+        ])
+        module = MockModule()
+
+        get_npod(module, client, "npod")
+
+        self.assertTrue(module.failed)
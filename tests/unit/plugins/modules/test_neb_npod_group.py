@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_npod_group import (
+    modify_npod_group,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockModule,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockNPodGroup:
+    def __init__(self, name, note):
+        self.uuid = "group1"
+        self.name = name
+        self.note = note
+
+
+class MockClient:
+    """Mocks a Nebulon ON client that records nPod group updates"""
+
+    def __init__(self):
+        self.updates = []
+
+    def update_npod_group(self, uuid=None, update_npod_group_input=None):
+        self.updates.append(update_npod_group_input)
+        return MockNPodGroup(
+            update_npod_group_input.name,
+            update_npod_group_input.note,
+        )
+
+
+class TestModifyNPodGroup(unittest.TestCase):
+    """Test class for modifying nPod groups"""
+
+    def test_unchanged(self):
+        """No update is sent when all properties match"""
+        client = MockClient()
+        module = MockModule(name="group", note="note")
+
+        result = modify_npod_group(module, client, MockNPodGroup("group", "note"))
+
+        self.assertFalse(result['changed'])
+        self.assertEqual([], client.updates)
+
+    def test_only_changes_sent(self):
+        """Only the properties that differ are sent"""
+        client = MockClient()
+        module = MockModule(name="group", note="new")
+
+        result = modify_npod_group(module, client, MockNPodGroup("group", "old"))
+
+        self.assertTrue(result['changed'])
+        self.assertEqual(1, len(client.updates))
+        self.assertIsNone(client.updates[0].name)
+        self.assertEqual("new", client.updates[0].note)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_npod_group_info import (
+    get_npod_groups,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockClient:
+    """Mocks a Nebulon ON client with a single nPod group"""
+
+    def __init__(self):
+        self.pages = []
+
+    def get_npod_groups(self, page=None, npod_group_filter=None):
+        self.pages.append(page)
+        return MockItemList([MockItem(uuid="group1", name="group")])
+
+
+class TestGetNPodGroups(unittest.TestCase):
+    """Test class for listing nPod groups"""
+
+    def test_uuid_single_item(self):
+        """Lookups by uuid request a single item"""
+        client = MockClient()
+
+        result = get_npod_groups(client, None, "group1")
+
+        self.assertEqual([{"uuid": "group1", "name": "group"}], result)
+        self.assertEqual(1, len(client.pages))
+        self.assertEqual(1, client.pages[0].count)
+
+    def test_name_paged(self):
+        """Lookups by name are paged as names may not be unique"""
+        client = MockClient()
+
+        result = get_npod_groups(client, "group", None)
+
+        self.assertEqual(1, len(result))
+        self.assertEqual(1, len(client.pages))
+        self.assertEqual(100, client.pages[0].count)
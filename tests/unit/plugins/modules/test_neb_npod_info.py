@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_npod_info import (
+    get_npod_list,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockModule,
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+class MockClient:
+    """Mocks a Nebulon ON client that returns one nPod per page"""
+
+    def __init__(self, page_count):
+        self.page_count = page_count
+        self.pages = []
+        self.filters = []
+        self.counts = []
+
+    def get_npods(self, page=None, npod_filter=None):
+        self.pages.append(page.page)
+        self.counts.append(page.count)
+        self.filters.append(npod_filter)
+        npod_list = MockItemList(
+            [MockItem(uuid=f"npod{page.page}")],
+            page.page < self.page_count,
+        )
+        npod_list.filtered_count = self.page_count
+        return npod_list
+
+
+class TestGetNPodList(unittest.TestCase):
+    """Test class for listing nPods"""
+
+    def test_pages_advance(self):
+        """Every page is requested exactly once"""
+        client = MockClient(3)
+
+        result = get_npod_list(MockModule(name=None, uuid=None), client)
+
+        self.assertEqual([1, 2, 3], sorted(client.pages))
+        self.assertIs(client.filters[0], client.filters[2])
+        self.assertEqual(
+            [{"uuid": "npod1"}, {"uuid": "npod2"}, {"uuid": "npod3"}],
+            result,
+        )
+
+    def test_uuid_single_page(self):
+        """Lookups by uuid stop after the first page"""
+        client = MockClient(3)
+
+        result = get_npod_list(MockModule(name=None, uuid="npod1"), client)
+
+        self.assertEqual([1], client.pages)
+        self.assertEqual(1, client.counts[0])
+        self.assertEqual([{"uuid": "npod1"}], result)
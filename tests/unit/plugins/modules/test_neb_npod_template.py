@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_npod_template import (
+    create_npod_template,
+    get_npod_template,
+    modify_npod_template,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockModule,
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+def template_params(**params):
+    result = dict(
+        name="template",
+        saving_factor=None,
+        mirrored_volume=None,
+        boot_volume=False,
+        os=None,
+        volume_size_bytes=None,
+        shared_volume=None,
+        boot_volume_size_bytes=None,
+        boot_image_url=None,
+        app=None,
+        note=None,
+        snapshot_schedule_template_uuids=None,
+        volume_count=None,
+        neb_username="user",
+        neb_password="password",
+        state="present",
+    )
+    result.update(params)
+    return result
+
+
+class MockClient:
+    """Mocks a Nebulon ON client with two versions of a nPod template"""
+
+    def __init__(self):
+        self.filters = []
+        self.updates = []
+        self.created = []
+
+    def create_npod_template(self, create_npod_template_input=None):
+        self.created.append(create_npod_template_input)
+        return MockItem(uuid="template1")
+
+    def update_npod_template(self, update_npod_template_input=None):
+        self.updates.append(update_npod_template_input)
+        return MockItem(uuid="template3")
+
+    def get_npod_templates(self, page=None, template_filter=None):
+        self.filters.append(template_filter)
+        if template_filter.name.equals != "template":
+            return MockItemList([])
+        return MockItemList([MockItem(uuid="template2", version=2)])
+
+
+class TestGetNPodTemplate(unittest.TestCase):
+    """Test class for looking up nPod templates by name"""
+
+    def test_last_version(self):
+        """Only the last version of the template is requested"""
+        client = MockClient()
+
+        npod_template = get_npod_template(client, "template")
+
+        self.assertEqual("template2", npod_template.uuid)
+        self.assertTrue(client.filters[0].and_filter.only_last_version)
+
+    def test_missing(self):
+        """None is returned for unknown names"""
+        self.assertIsNone(get_npod_template(MockClient(), "other"))
+
+
+class TestModifyNPodTemplate(unittest.TestCase):
+    """Test class for modifying nPod templates"""
+
+    @staticmethod
+    def template():
+        return MockItem(
+            uuid="template2",
+            name="template",
+            boot_volume=False,
+            shared_lun=False,
+            os="Linux",
+        )
+
+    def test_unchanged(self):
+        """No update is sent when the parameters match"""
+        client = MockClient()
+        module = MockModule(**template_params(os="Linux", shared_volume=False))
+
+        result = modify_npod_template(module, client, self.template())
+
+        self.assertFalse(result['changed'])
+        self.assertEqual([], client.updates)
+
+    def test_shared_volume_changed(self):
+        """shared_volume is compared against the template's shared_lun"""
+        client = MockClient()
+        module = MockModule(**template_params(shared_volume=True))
+
+        result = modify_npod_template(module, client, self.template())
+
+        self.assertTrue(result['changed'])
+        self.assertTrue(client.updates[0].shared_lun)
+
+    def test_only_changes_sent(self):
+        """Unchanged properties are not resubmitted"""
+        client = MockClient()
+        module = MockModule(**template_params(os="Windows", shared_volume=False))
+
+        modify_npod_template(module, client, self.template())
+
+        self.assertEqual("template", client.updates[0].name)
+        self.assertEqual("Windows", client.updates[0].os)
+        self.assertIsNone(client.updates[0].shared_lun)
+        self.assertIsNone(client.updates[0].boot_volume)
+
+
+class TestCreateNPodTemplate(unittest.TestCase):
+    """Test class for creating nPod templates"""
+
+    def test_create_arguments(self):
+        """Module parameters are mapped to the SDK input"""
+        client = MockClient()
+        module = MockModule(**template_params(
+            os="Linux", shared_volume=True, volume_count=2))
+
+        result = create_npod_template(module, client)
+
+        self.assertTrue(result['changed'])
+        created = client.created[0]
+        self.assertEqual("template", created.name)
+        self.assertEqual("Linux", created.os)
+        self.assertTrue(created.shared_lun)
+        self.assertEqual(2, created.volume_count)
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import unittest
+
+# pylint: disable=import-error,no-name-in-module
+from ansible_collections.nebulon.nebulon_on.plugins.modules.neb_npod_template_info import (
+    get_npod_template,
+    get_npod_template_by_uuid,
+)
+from ansible_collections.nebulon.nebulon_on.tests.unit.plugins.modules.utils import (
+    MockModule,
+    MockItem,
+    MockItemList,
+)
+# pylint: enable=import-error,no-name-in-module
+
+
+#
+# MOCK SECTION
+#
+
+def template_info_params(**params):
+    result = dict(
+        name=None,
+        uuid=None,
+        app=None,
+        os=None,
+        only_last_version=True,
+    )
+    result.update(params)
+    return result
+
+
+class MockPagedClient:
+    """Mocks a Nebulon ON client with one nPod template per page"""
+
+    def __init__(self, page_count):
+        self.page_count = page_count
+        self.pages = []
+
+    def get_npod_templates(self, page=None, template_filter=None):
+        self.pages.append(page.page)
+        result = MockItemList([MockItem(uuid=f"template{page.page}")])
+        result.filtered_count = self.page_count
+        result.more = page.page < self.page_count
+        return result
+
+
+class MockClient:
+    """Mocks a Nebulon ON client with a single nPod template"""
+
+    def __init__(self):
+        self.filters = []
+
+    def get_npod_templates(self, page=None, template_filter=None):
+        self.filters.append(template_filter)
+        if template_filter.uuid is not None and template_filter.uuid.equals != "template1":
+            return MockItemList([])
+        return MockItemList([MockItem(uuid="template1")])
+
+
+def filter_levels(template_filter):
+    """Returns the properties set on every level of a filter chain"""
+    levels = []
+    while template_filter is not None:
+        level = {}
+        for field in ("uuid", "name", "app", "os"):
+            value = getattr(template_filter, field)
+            if value is not None:
+                level[field] = value.equals
+        if template_filter.only_last_version is not None:
+            level["only_last_version"] = template_filter.only_last_version
+        levels.append(level)
+        template_filter = template_filter.and_filter
+    return levels
+
+
+class TestGetNPodTemplateByUuid(unittest.TestCase):
+    """Test class for looking up nPod templates by uuid"""
+
+    def test_filter_chain(self):
+        """The uuid and version flag are chained without app or os"""
+        client = MockClient()
+        module = MockModule(**template_info_params(uuid="template1"))
+
+        result = get_npod_template_by_uuid(module, client)
+
+        self.assertEqual([{"uuid": "template1"}], result)
+        levels = filter_levels(client.filters[0])
+        self.assertEqual(
+            [{"uuid": "template1"}, {"only_last_version": True}],
+            levels,
+        )
+
+    def test_optional_filters(self):
+        """Provided app and os parameters are chained"""
+        client = MockClient()
+        module = MockModule(**template_info_params(
+            uuid="template1", app="app1", os="os1"))
+
+        get_npod_template_by_uuid(module, client)
+
+        levels = filter_levels(client.filters[0])
+        self.assertEqual(
+            [
+                {"uuid": "template1"},
+                {"app": "app1"},
+                {"os": "os1"},
+                {"only_last_version": True},
+            ],
+            levels,
+        )
+
+    def test_missing(self):
+        """An empty list is returned for unknown uuids"""
+        module = MockModule(**template_info_params(uuid="other"))
+
+        result = get_npod_template_by_uuid(module, MockClient())
+
+        self.assertEqual([], result)
+
+
+class TestGetNPodTemplate(unittest.TestCase):
+    """Test class for listing nPod templates"""
+
+    def test_no_null_predicates(self):
+        """Parameters that are not provided are not sent"""
+        client = MockClient()
+
+        get_npod_template(MockModule(**template_info_params()), client)
+
+        levels = filter_levels(client.filters[0])
+        self.assertEqual([{"only_last_version": True}], levels)
+
+    def test_name_filter(self):
+        """The name is matched when provided"""
+        client = MockClient()
+        module = MockModule(**template_info_params(name="template", os="os1"))
+
+        get_npod_template(module, client)
+
+        levels = filter_levels(client.filters[0])
+        self.assertEqual(
+            [{"name": "template"}, {"os": "os1"}, {"only_last_version": True}],
+            levels,
+        )
+
+    def test_pages_from_count(self):
+        """Pages are requested once each, as derived from filtered_count"""
+        client = MockPagedClient(3)
+
+        result = get_npod_template(MockModule(**template_info_params()), client)
+
+        self.assertEqual([1, 2, 3], sorted(client.pages))
+        self.assertEqual(
+            [{"uuid": "template1"}, {"uuid": "template2"}, {"uuid": "template3"}],
+            result,
+        )
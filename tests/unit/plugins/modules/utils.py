@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+#
+# Copyright (C) 2022 Nebulon, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+#
+# Mocks shared by the module unit tests. They mimic the objects returned by
+# the Nebulon Python SDK and the AnsibleModule methods used by the modules.
+#
+
+class MockModule:
+    """Mocks an AnsibleModule with the provided parameters"""
+
+    def __init__(self, **params):
+        self.params = params
+        self.failed = False
+        self.fail_kwargs = None
+
+    def fail_json(self, **kwargs):
+        self.failed = True
+        self.fail_kwargs = kwargs
+
+
+class MockItem:
+    """Mocks an SDK object with the provided fields"""
+
+    def __init__(self, **fields):
+        for key, value in fields.items():
+            setattr(self, key, value)
+
+
+class MockItemList:
+    """Mocks a page of SDK objects
+
+    All items count towards filtered_count, while only the first count items
+    are returned in the page if count is provided.
+    """
+
+    def __init__(self, items, more=False, count=None):
+        self.filtered_count = len(items)
+        self.items = items if count is None else items[:count]
+        self.more = more